@@ -10,46 +10,124 @@ Usage:
 This file provides a small, dependency-free notifier using pygame only.
 """
 import os
-import time
 import pygame
-from typing import Optional, List
+from collections import deque
+from typing import Optional, Deque, Dict, Iterable, Tuple
 
 BASE_DIR = os.path.dirname(__file__)
 
+# Pre-rendered popup surfaces shared by popups with identical content:
+# {(title, subtitle, image): surface}. Keyed on the image Surface itself
+# (hashed by identity) so a cached entry keeps its image alive and a recycled
+# id() can never hand back another popup's artwork.
+_popup_cache = {}
+_POPUP_CACHE_MAX = 64
+
+# Fade alpha lookup tables {length_ms: ramp}, where ramp[i] == 255 * i // length_ms
+_fade_ramps = {}
+
+
+def _fade_ramp(length_ms: int) -> bytes:
+	ramp = _fade_ramps.get(length_ms)
+	if ramp is None:
+		ramp = bytes(255 * i // length_ms for i in range(length_ms))
+		_fade_ramps[length_ms] = ramp
+	return ramp
+
+
+def _blit_all(target: pygame.Surface, blit_list):
+	"""Blit a list of (surface, pos) pairs in one call where pygame allows it.
+
+	Uses pygame-ce's `fblits()` when present, `blits()` on pygame 2 and a plain
+	`blit()` loop otherwise.
+	"""
+	if hasattr(target, 'fblits'):
+		target.fblits(blit_list)
+	elif hasattr(target, 'blits'):
+		target.blits(blit_list, doreturn=False)
+	else:
+		for src, pos in blit_list:
+			target.blit(src, pos)
+
+
+# Past this many rects, or this much total area, one full flip() is cheaper
+# than handing SDL a rect list.
+_PRESENT_MAX_RECTS = 5
+_PRESENT_MAX_AREA = 256 * 256
+
+
+def smart_present(rects: Optional[Iterable[pygame.Rect]] = None) -> None:
+	"""Present the frame, updating only `rects` when that is cheaper than flip().
+
+	Pass None to present the whole screen; an empty list presents nothing.
+	"""
+	if rects is None:
+		pygame.display.flip()
+		return
+	rects = [r for r in rects if r]
+	if not rects:
+		return
+	if len(rects) > _PRESENT_MAX_RECTS or sum(r.w * r.h for r in rects) > _PRESENT_MAX_AREA:
+		pygame.display.flip()
+	else:
+		pygame.display.update(rects)
+
+
+def _to_display_format(surf: pygame.Surface) -> pygame.Surface:
+	"""convert_alpha() a surface that is blitted every frame, once a display exists."""
+	if pygame.display.get_surface() is None:
+		return surf
+	return surf.convert_alpha()
+
 
 class AchievementPopup:
+	__slots__ = ('title', 'subtitle', 'image', 'duration', 'placement', 'start_ms',
+				 'fade_in', 'fade_out', '_duration_ms', '_fade_in_ms', '_fade_out_ms',
+				 '_ramp_in', '_ramp_out', '_cached_surf')
+
 	def __init__(self, title: str, subtitle: str = "", image: Optional[pygame.Surface] = None,
-				 duration: float = 4.0):
+				 duration: float = 4.0, placement: str = 'bottom-right'):
 		self.title = title
 		self.subtitle = subtitle
 		self.image = image
 		self.duration = duration  # seconds visible including fades
-		# Use pygame ticks if available, otherwise fallback to time.time()
-		try:
-			self.start_ms = pygame.time.get_ticks()
-		except Exception:
-			self.start_ms = int(time.time() * 1000)
+		# 'bottom-right' or 'bottom-left'
+		self.placement = placement
+		self.start_ms = pygame.time.get_ticks()
 		# animation timings (seconds)
 		self.fade_in = 0.35
 		self.fade_out = 0.6
+		# integer-millisecond timings and fade tables used by alpha()
+		self._duration_ms = int(duration * 1000)
+		self._fade_in_ms = int(self.fade_in * 1000)
+		self._fade_out_ms = int(self.fade_out * 1000)
+		self._ramp_in = _fade_ramp(self._fade_in_ms)
+		self._ramp_out = _fade_ramp(self._fade_out_ms)
+		# composed popup body, built once by AchievementNotifier.show()
+		self._cached_surf = None
 
-	def elapsed(self) -> float:
-		return (pygame.time.get_ticks() - self.start_ms) / 1000.0
+	def elapsed(self, now_ms: Optional[int] = None) -> float:
+		if now_ms is None:
+			now_ms = pygame.time.get_ticks()
+		return (now_ms - self.start_ms) / 1000.0
 
-	def alpha(self) -> int:
-		e = self.elapsed()
-		if e < self.fade_in:
+	def alpha(self, now_ms: Optional[int] = None) -> int:
+		if now_ms is None:
+			now_ms = pygame.time.get_ticks()
+		e = now_ms - self.start_ms
+		if e < self._fade_in_ms:
 			# fade in
-			return int(255 * (e / max(1e-6, self.fade_in)))
-		elif e > (self.duration - self.fade_out):
+			return self._ramp_in[e] if e > 0 else 0
+		remaining = self._duration_ms - e
+		if remaining < self._fade_out_ms:
 			# fade out
-			t = (e - (self.duration - self.fade_out)) / max(1e-6, self.fade_out)
-			return int(255 * max(0.0, 1.0 - t))
-		else:
-			return 255
+			return self._ramp_out[remaining] if remaining > 0 else 0
+		return 255
 
-	def is_expired(self) -> bool:
-		return self.elapsed() > self.duration
+	def is_expired(self, now_ms: Optional[int] = None) -> bool:
+		if now_ms is None:
+			now_ms = pygame.time.get_ticks()
+		return now_ms - self.start_ms > self._duration_ms
 
 
 class AchievementNotifier:
@@ -66,13 +144,25 @@ class AchievementNotifier:
 	SHADOW_OFFSET = 6
 
 	def __init__(self, default_placement: str = 'bottom-right'):
-		self.queue: List[AchievementPopup] = []
+		# popups in show() order; the oldest one is always the first to expire
+		self.queue: Deque[AchievementPopup] = deque()
 		# Defer font creation until pygame.font is initialized
 		self.font_title = None
 		self.font_sub = None
 		self.font_header = None
 		# default placement: 'bottom-right' or 'bottom-left'
 		self.default_placement = default_placement
+		# pre-rendered (title, subtitle) text surfaces filled by preload()
+		self._text_cache: Dict[Tuple[str, str], Tuple[Optional[pygame.Surface], Optional[pygame.Surface]]] = {}
+		# scaled thumbnails keyed by the path passed to load_image()
+		self._image_cache: Dict[str, pygame.Surface] = {}
+		# thumbnail used for popups without an image, created on first use
+		self._placeholder_thumb = None
+		# solid black shadow shared by every popup, faded via surface alpha
+		self._shadow_template = None
+		# frame timestamp captured by update() and reused by draw(); cleared by
+		# show() so a popup added after an idle spell is not drawn against it
+		self._now_ms = None
 
 	def ensure_fonts(self):
 		"""Create font objects if not already created. Safe to call before pygame.init()."""
@@ -88,20 +178,47 @@ class AchievementNotifier:
 			self.font_title = None
 			self.font_sub = None
 
+	def preload(self, achievements: Iterable[Tuple[str, str]]):
+		"""Pre-render popup text for known (title, subtitle) pairs.
+
+		Call once at startup so showing those achievements never touches the
+		font renderer; other strings are still rendered on demand.
+		"""
+		self.ensure_fonts()
+		for title, subtitle in achievements:
+			self._text_cache[(title, subtitle)] = self._render_text(title, subtitle)
+
+	def _render_text(self, title: str, subtitle: str):
+		"""Return (title_surf, sub_surf) for a popup; either may be None."""
+		cached = self._text_cache.get((title, subtitle))
+		if cached is not None:
+			return cached
+		title_surf = sub_surf = None
+		if self.font_title is not None:
+			title_surf = self.font_title.render(title, True, (255, 255, 255))
+		if subtitle and self.font_sub is not None:
+			sub_surf = self.font_sub.render(subtitle, True, (200, 200, 200))
+		return title_surf, sub_surf
+
 	def load_image(self, path: Optional[str]) -> Optional[pygame.Surface]:
 		if not path:
 			return None
+		cached = self._image_cache.get(path)
+		if cached is not None:
+			return cached
 		# resolve relative to project base if not absolute
-		if not os.path.isabs(path):
-			cand = os.path.join(BASE_DIR, '..', path)
+		resolved = path
+		if not os.path.isabs(resolved):
+			cand = os.path.join(BASE_DIR, '..', resolved)
 			if os.path.exists(cand):
-				path = cand
+				resolved = cand
 		try:
-			img = pygame.image.load(path).convert_alpha()
+			img = pygame.image.load(resolved).convert_alpha()
 			img = pygame.transform.smoothscale(img, (self.THUMB, self.THUMB))
-			return img
 		except Exception:
 			return None
+		self._image_cache[path] = img
+		return img
 
 	def show(self, title: str, subtitle: str = "", image_path: Optional[str] = None,
 			 image: Optional[pygame.Surface] = None, duration: float = 4.0,
@@ -113,92 +230,157 @@ class AchievementNotifier:
 			img = image
 		else:
 			img = self.load_image(image_path) if image_path else None
-		p = AchievementPopup(title, subtitle, img, duration)
 		# per-popup placement (overrides notifier default)
-		p.placement = placement or self.default_placement
+		p = AchievementPopup(title, subtitle, img, duration,
+							 placement=placement or self.default_placement)
+		self._build_popup_surface(p)
 		self.queue.append(p)
+		# update() skips an empty queue without refreshing the frame timestamp,
+		# so drop the stale one; draw() falls back to get_ticks() until the
+		# next update()
+		self._now_ms = None
 
-	def update(self):
-		# Remove expired popups
-		self.queue = [p for p in self.queue if not p.is_expired()]
+	def _get_placeholder_thumb(self) -> pygame.Surface:
+		"""Return the shared placeholder box drawn when a popup has no image."""
+		if self._placeholder_thumb is None:
+			# placeholder box with a subtle border
+			box = pygame.Surface((self.THUMB, self.THUMB), pygame.SRCALPHA)
+			box.fill((80, 120, 200, 220))
+			pygame.draw.rect(box, (255, 255, 255, 40), box.get_rect(), 2)
+			self._placeholder_thumb = _to_display_format(box)
+		return self._placeholder_thumb
 
-	def draw(self, surface: pygame.Surface):
-		# Ensure fonts exist before drawing
-		self.ensure_fonts()
-		# Draw stacked; each popup may specify placement
-		sw, sh = surface.get_size()
+	def _get_shadow_template(self) -> pygame.Surface:
+		"""Return the shared popup shadow, created on first use."""
+		if self._shadow_template is None:
+			shadow = pygame.Surface((self.WIDTH, self.HEIGHT))
+			shadow.fill((0, 0, 0))
+			if pygame.display.get_surface() is not None:
+				shadow = shadow.convert()
+			self._shadow_template = shadow
+		return self._shadow_template
 
-		# draw last in queue at bottom
-		for popup in reversed(self.queue):
-			placement = getattr(popup, 'placement', self.default_placement)
-			alpha = popup.alpha()
-			# compute stack index and offset
-			idx = list(reversed(self.queue)).index(popup)
-			stack_offset = idx * (self.HEIGHT + 8)
-			if placement == 'bottom-left':
-				x = self.PADDING
-				y = sh - self.PADDING - self.HEIGHT - stack_offset
-			else:
-				# bottom-right (default)
-				x = sw - self.WIDTH - self.PADDING
-				y = sh - self.PADDING - self.HEIGHT - stack_offset
+	def _build_popup_surface(self, popup: AchievementPopup):
+		"""Render the popup body once at full opacity.
 
-			# background surface per-popup to allow fade
+		The result only depends on the popup content, so it is shared through
+		`_popup_cache`; `draw()` then just applies the fade alpha and blits.
+		"""
+		key = (popup.title, popup.subtitle, popup.image)
+		cached = _popup_cache.get(key)
+		if cached is None:
 			surf = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
 			# semi-opaque dark background
-			surf.fill((20, 20, 30, int(220 * (alpha / 255))))
+			surf.fill((20, 20, 30, 220))
 			# rounded rect background for nicer style (pygame 2+ supports border_radius)
 			try:
-				pygame.draw.rect(surf, (24, 24, 34, int(230 * (alpha / 255))), surf.get_rect(), border_radius=8)
+				pygame.draw.rect(surf, (24, 24, 34, 230), surf.get_rect(), border_radius=8)
 			except Exception:
 				pass
 
 			# draw thumb
 			img_x = 12
 			img_y = (self.HEIGHT - self.THUMB) // 2
-			if popup.image:
-				img = popup.image.copy()
-				img.set_alpha(alpha)
-				surf.blit(img, (img_x, img_y))
-			else:
-				# placeholder box with a subtle border
-				box = pygame.Surface((self.THUMB, self.THUMB), pygame.SRCALPHA)
-				box.fill((80, 120, 200, int(220 * (alpha / 255))))
-				pygame.draw.rect(box, (255, 255, 255, int(40 * (alpha / 255))), box.get_rect(), 2)
-				surf.blit(box, (img_x, img_y))
+			thumb = popup.image if popup.image else self._get_placeholder_thumb()
+			blit_list = [(thumb, (img_x, img_y))]
 
 			# draw text
 			tx = img_x + self.THUMB + 12
 			ty = 12
-			title_surf = self.font_title.render(popup.title, True, (255, 255, 255))
-			title_surf.set_alpha(alpha)
-			surf.blit(title_surf, (tx, ty))
-
-			if popup.subtitle:
-				sub_surf = self.font_sub.render(popup.subtitle, True, (200, 200, 200))
-				sub_surf.set_alpha(alpha)
-				surf.blit(sub_surf, (tx, ty + 28))
+			title_surf, sub_surf = self._render_text(popup.title, popup.subtitle)
+			if title_surf is not None:
+				blit_list.append((title_surf, (tx, ty)))
+			if sub_surf is not None:
+				blit_list.append((sub_surf, (tx, ty + 28)))
+			_blit_all(surf, blit_list)
 
 			# border
 			try:
-				pygame.draw.rect(surf, (100, 100, 120, int(140 * (alpha / 255))), surf.get_rect(), 1, border_radius=8)
+				pygame.draw.rect(surf, (100, 100, 120, 140), surf.get_rect(), 1, border_radius=8)
 			except Exception:
 				pass
 
-			# shadow behind popup for depth (offset depends on placement)
-			shadow = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-			shadow.fill((0, 0, 0, int(120 * (alpha / 255))))
+			cached = _to_display_format(surf)
+			if len(_popup_cache) >= _POPUP_CACHE_MAX:
+				_popup_cache.clear()
+			_popup_cache[key] = cached
+		popup._cached_surf = cached
+
+	def update(self, now_ms: Optional[int] = None):
+		"""Capture the frame timestamp and remove expired popups.
+
+		Popups are dropped from the front of the queue only; an expired popup
+		queued behind a longer-lived one lingers until that one expires, but
+		`draw()` skips it so it leaves no gap in the stack.
+		"""
+		queue = self.queue
+		if not queue:
+			return
+		if now_ms is None:
+			now_ms = pygame.time.get_ticks()
+		self._now_ms = now_ms
+		while queue and queue[0].is_expired(now_ms):
+			queue.popleft()
+
+	def draw(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+		"""Draw all queued popups onto `surface`.
+
+		Returns one rect covering every popup and its shadow (or None when
+		nothing was drawn) so static scenes can pass `[rect]` to
+		`smart_present()` instead of flipping the whole screen.
+		"""
+		if not self.queue:
+			return None
+		# Draw stacked; each popup may specify placement
+		sw, sh = surface.get_size()
+
+		stack_step = self.HEIGHT + 8
+		now_ms = self._now_ms if self._now_ms is not None else pygame.time.get_ticks()
+		shadow = self._get_shadow_template()
+		dirty = None
+
+		# draw last in queue at bottom; expired popups still queued behind a
+		# longer-lived one are skipped without taking a stack slot
+		idx = -1
+		for popup in reversed(self.queue):
+			if popup.is_expired(now_ms):
+				continue
+			idx += 1
+			placement = popup.placement
+			alpha = popup.alpha(now_ms)
+			if alpha <= 0:
+				# fully faded out (or not yet faded in): nothing visible to draw
+				continue
+			stack_offset = idx * stack_step
+			if placement == 'bottom-left':
+				x = self.PADDING
+				y = sh - self.PADDING - self.HEIGHT - stack_offset
+			else:
+				# bottom-right (default)
+				x = sw - self.WIDTH - self.PADDING
+				y = sh - self.PADDING - self.HEIGHT - stack_offset
+
+			if popup._cached_surf is None:
+				self._build_popup_surface(popup)
+			# surface alpha multiplies the baked per-pixel alpha, giving the fade
+			surf = popup._cached_surf
+			surf.set_alpha(alpha)
+			shadow.set_alpha(alpha * 120 // 255)
+
+			# shadow behind popup for depth (offset depends on placement),
+			# then the composed popup on top of it
 			if placement == 'bottom-left':
-				surface.blit(shadow, (x - self.SHADOW_OFFSET, y + self.SHADOW_OFFSET))
+				shadow_pos = (x - self.SHADOW_OFFSET, y + self.SHADOW_OFFSET)
 			else:
-				surface.blit(shadow, (x + self.SHADOW_OFFSET, y + self.SHADOW_OFFSET))
+				shadow_pos = (x + self.SHADOW_OFFSET, y + self.SHADOW_OFFSET)
+			_blit_all(surface, [(shadow, shadow_pos), (surf, (x, y))])
 
-			# finally blit the composed popup onto the target surface
-			surface.blit(surf, (x, y))
+			area = pygame.Rect(min(x, shadow_pos[0]), y,
+							   self.WIDTH + self.SHADOW_OFFSET, self.HEIGHT + self.SHADOW_OFFSET)
+			dirty = area if dirty is None else dirty.union(area)
 
-			y -= 8  # small gap between stacked popups
+		return dirty
 
 
 # Convenience singleton used by game code
 notifier = AchievementNotifier()
-
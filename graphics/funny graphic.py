@@ -1,11 +1,15 @@
 import pygame
 import random
 import math
+from dataclasses import dataclass
+
+import numpy as np
 
 # --- Screen Settings ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 180  # Frames per second
+ROTATION_STEP = 4  # Degrees between pre-rendered rotation frames
 
 # --- Colors ---
 WHITE = (255, 255, 255)
@@ -14,24 +18,32 @@ GREEN = (30, 86, 49)  # A nice table green
 
 
 class Die:
-    """A class to manage a single die's state, movement, and drawing."""
+    """A class to manage a single die's face image and drawing.
+
+    Position, velocity and rotation live in `DiceSoA` so the whole group can
+    be updated with a few array operations per frame.
+    """
 
-    def __init__(self, x, y, size=70):
+    # Rotated face images shared by all dice: {(size, value): [Surface, ...]}
+    _ROTATION_CACHE = {}
+
+    def __init__(self, size=70):
         self.size = size
         self.value = random.randint(1, 6)
 
         # Create the base image of the die (unrotated)
         self.original_image = self._create_image()
-        self.image = self.original_image.copy()  # The image that will be rotated
-
-        # Position and movement state
-        self.rect = self.image.get_rect(center=(x, y))
-        self.vx = random.uniform(-3, 3)  # Horizontal velocity
-        self.vy = random.uniform(-3, 3)  # Vertical velocity
-
-        # Rotation state
-        self.angle = random.uniform(0, 360)
-        self.angular_velocity = random.uniform(-4, 4)
+        self.rotations = self._get_rotations()
+
+    def _get_rotations(self):
+        """Return this face pre-rotated every ROTATION_STEP degrees."""
+        key = (self.size, self.value)
+        frames = Die._ROTATION_CACHE.get(key)
+        if frames is None:
+            frames = [pygame.transform.rotate(self.original_image, a).convert_alpha()
+                      for a in range(0, 360, ROTATION_STEP)]
+            Die._ROTATION_CACHE[key] = frames
+        return frames
 
     def _create_image(self):
         """Creates the static surface for a single die face."""
@@ -67,32 +79,55 @@ class Die:
 
         return image
 
+    def draw(self, surface, center, angle):
+        """Draw the die rotated by `angle` degrees, centred on `center`."""
+        image = self.rotations[int(angle) // ROTATION_STEP % len(self.rotations)]
+        surface.blit(image, image.get_rect(center=center))
+
+
+@dataclass
+class DiceSoA:
+    """Movement and rotation state for a group of dice, one array per field.
+
+    `x` and `y` are die centres; index i belongs to the i-th `Die`.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    vx: np.ndarray
+    vy: np.ndarray
+    angle: np.ndarray
+    angular_velocity: np.ndarray
+    size: np.ndarray
+
+    @classmethod
+    def spawn(cls, dice):
+        """Random starting state for the given list of `Die` objects."""
+        n = len(dice)
+        return cls(
+            x=np.array([random.randint(100, SCREEN_WIDTH - 100) for _ in range(n)], dtype=np.float64),
+            y=np.array([random.randint(100, SCREEN_HEIGHT - 100) for _ in range(n)], dtype=np.float64),
+            vx=np.array([random.uniform(-3, 3) for _ in range(n)]),  # Horizontal velocity
+            vy=np.array([random.uniform(-3, 3) for _ in range(n)]),  # Vertical velocity
+            angle=np.array([random.uniform(0, 360) for _ in range(n)]),
+            angular_velocity=np.array([random.uniform(-4, 4) for _ in range(n)]),
+            size=np.array([die.size for die in dice], dtype=np.float64),
+        )
+
     def update(self):
-        """Update the die's position and rotation for one frame."""
+        """Update every die's position and rotation for one frame."""
         # --- Update Rotation ---
         self.angle += self.angular_velocity
         # To avoid large numbers, keep angle between 0 and 360
-        if self.angle > 360: self.angle -= 360
-        if self.angle < 0: self.angle += 360
-
-        # Create a new rotated image and update its rectangle
-        old_center = self.rect.center
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        self.rect = self.image.get_rect(center=old_center)
+        np.mod(self.angle, 360, out=self.angle)
 
         # --- Update Position and Bounce ---
-        self.rect.x += self.vx
-        self.rect.y += self.vy
+        self.x += self.vx
+        self.y += self.vy
 
         # Bounce off the walls by reversing velocity
-        if self.rect.left < 0 or self.rect.right > SCREEN_WIDTH:
-            self.vx *= -1
-        if self.rect.top < 0 or self.rect.bottom > SCREEN_HEIGHT:
-            self.vy *= -1
-
-    def draw(self, surface):
-        """Draw the die onto the provided surface."""
-        surface.blit(self.image, self.rect)
+        half = self.size / 2
+        self.vx[(self.x - half < 0) | (self.x + half > SCREEN_WIDTH)] *= -1
+        self.vy[(self.y - half < 0) | (self.y + half > SCREEN_HEIGHT)] *= -1
 
 
 def main():
@@ -104,8 +139,8 @@ def main():
 
     # Create a group of dice
     num_dice = 5
-    dice_group = [Die(random.randint(100, SCREEN_WIDTH - 100), random.randint(100, SCREEN_HEIGHT - 100)) for _ in
-                  range(num_dice)]
+    dice_group = [Die() for _ in range(num_dice)]
+    state = DiceSoA.spawn(dice_group)
 
     running = True
     while running:
@@ -115,13 +150,12 @@ def main():
                 running = False
 
         # --- Update ---
-        for die in dice_group:
-            die.update()
+        state.update()
 
         # --- Draw ---
         screen.fill(GREEN)
-        for die in dice_group:
-            die.draw(screen)
+        for die, x, y, angle in zip(dice_group, state.x, state.y, state.angle):
+            die.draw(screen, (x, y), angle)
 
         pygame.display.flip()
 
@@ -1,12 +1,19 @@
 import typing
+from types import MappingProxyType
 from typing import Dict, List
-import pygame
+try:
+    import pygame
+    _PG_OK = True
+except Exception:
+    _PG_OK = False
 try:
     from graphics.achivments import notifier
 except Exception:
     # Fallback no-op notifier to avoid import-time failures when pygame isn't
     # initialized or graphics module cannot be imported.
     class _DummyNotifier:
+        __slots__ = ()
+
         def show(self, *a, **k):
             return
         def update(self, *a, **k):
@@ -75,99 +82,189 @@ DEFAULT_ACHIEVEMENTS: List[Dict] = [
 ]
 
 
+def _build_tables(defaults: List[Dict]):
+    """Split achievement records into parallel (ids, titles, descs) tuples plus an id->index map."""
+    ids = tuple(a['id'] for a in defaults)
+    titles = tuple(a.get('title', 'Achievement') for a in defaults)
+    descs = tuple(a.get('desc', '') for a in defaults)
+    return ids, titles, descs, {aid: i for i, aid in enumerate(ids)}
+
+
+# Read-only metadata for DEFAULT_ACHIEVEMENTS, shared by every manager instance.
+_IDS, _TITLES, _DESCS, _ID_INDEX = _build_tables(DEFAULT_ACHIEVEMENTS)
+
+
 class AchievementsManager:
     """In-memory achievements manager for the running session.
 
     This manager does not persist by default (Option A). Use `unlock(id)` to
     mark an achievement unlocked during the session; this will also show the
     popup via the notifier.
+
+    Titles and descriptions are kept in shared tuples; the only per-instance
+    state is one unlocked byte per achievement.
     """
 
+    __slots__ = ('_defaults', '_ids', '_titles', '_descs', '_index', '_unlocked', '_view')
+
     def __init__(self, defaults: List[Dict] = None):
         self._defaults = defaults or DEFAULT_ACHIEVEMENTS
-        # store by id for quick lookup
-        self._ach: Dict[str, Dict] = {}
-        for a in self._defaults:
-            self._ach[a['id']] = dict(a)
+        if self._defaults is DEFAULT_ACHIEVEMENTS:
+            self._ids, self._titles, self._descs, self._index = _IDS, _TITLES, _DESCS, _ID_INDEX
+        else:
+            self._ids, self._titles, self._descs, self._index = _build_tables(self._defaults)
+        self._unlocked = bytearray(1 if a.get('unlocked') else 0 for a in self._defaults)
+        # read-only views returned by get_all; rebuilt after unlock/reset
+        self._view = None
 
     def get_all(self) -> List[Dict]:
-        """Return a list of achievement dicts (id,title,desc,unlocked)."""
-        return [dict(v) for v in self._ach.values()]
+        """Return read-only achievement mappings (id,title,desc,unlocked).
+
+        The same list is returned until the unlocked state changes, so
+        callers must not modify it.
+        """
+        if self._view is None:
+            self._view = [
+                MappingProxyType({'id': aid, 'title': title, 'desc': desc, 'unlocked': bool(flag)})
+                for aid, title, desc, flag in zip(self._ids, self._titles, self._descs, self._unlocked)
+            ]
+        return self._view
 
     def is_unlocked(self, aid: str) -> bool:
-        a = self._ach.get(aid)
-        return bool(a and a.get('unlocked'))
+        i = self._index.get(aid)
+        return i is not None and bool(self._unlocked[i])
 
     def unlock(self, aid: str) -> bool:
         """Mark achievement unlocked for this session. Returns True when state changed."""
-        a = self._ach.get(aid)
-        if not a:
+        i = self._index.get(aid)
+        if i is None:
             return False
-        if a.get('unlocked'):
+        if self._unlocked[i]:
             return False
-        a['unlocked'] = True
+        self._unlocked[i] = 1
+        self._view = None
+        title, desc = self._titles[i], self._descs[i]
         # show a popup via the notifier, with a small procedurally generated
         # pixel-art icon to match the Achievements menu.
         try:
-            icon = _get_icon_surface(aid, 64, True)
-            notifier.show(a.get('title', 'Achievement'), a.get('desc', ''), image=icon, placement='bottom-right')
+            icon = get_icon_surface(aid, 64, True)
+            notifier.show(title, desc, image=icon, placement='bottom-right')
         except Exception:
             try:
-                notifier.show(a.get('title', 'Achievement'), a.get('desc', ''), placement='bottom-right')
+                notifier.show(title, desc, placement='bottom-right')
             except Exception:
                 pass
         return True
 
     def reset_session(self):
         """Reset unlocked flags for current session."""
-        for a in self._ach.values():
-            a['unlocked'] = False
+        self._unlocked[:] = bytes(len(self._unlocked))
+        self._view = None
 
 
-def _get_icon_surface(aid: str, size: int, unlocked: bool) -> 'pygame.Surface':
-    """Create a small pixel-art surface for the given achievement id.
-
-    This duplicates the style used in the AchievementsMenu so the popup and
-    the menu match visually.
-    """
-    try:
-        import pygame
-    except Exception:
-        return None
+# Simple palette
+_PALETTE = [
+    (220, 80, 60),
+    (80, 180, 120),
+    (90, 120, 220),
+    (200, 140, 220),
+    (240, 200, 90),
+]
 
-    # Simple palette
-    _palette = [
-        (220, 80, 60),
-        (80, 180, 120),
-        (90, 120, 220),
-        (200, 140, 220),
-        (240, 200, 90),
-    ]
 
-    key = (aid, size, bool(unlocked))
-    # deterministic pseudo-random from id
+def _icon_meta(aid: str) -> tuple:
+    """(seed, unlocked colour) for an id; deterministic pseudo-random from id."""
     seed = abs(hash(aid))
-    color = _palette[seed % len(_palette)] if unlocked else (120, 120, 120)
+    return seed, _PALETTE[seed % len(_PALETTE)]
 
-    surf = pygame.Surface((size, size), pygame.SRCALPHA)
-    grid = 6
-    cell = size // grid
+
+_ICON_META: Dict[str, tuple] = {aid: _icon_meta(aid) for aid in _IDS}
+
+# Generated icons keyed by (aid, size, unlocked); icons are deterministic per id.
+_ICON_CACHE: Dict[tuple, 'pygame.Surface'] = {}
+
+
+def _icon_mask(grid: int, seed: int, unlocked: bool) -> bytearray:
+    """Row-major on/off flags (1/0) for a grid x grid icon pattern."""
+    mask = bytearray(grid * grid)
+    low = seed & 0xFF
+    i = 0
     for gy in range(grid):
         for gx in range(grid):
-            idx = (gx + gy * grid) ^ (seed & 0xFF)
+            idx = (gx + gy * grid) ^ low
             on = (idx % 3) == 0 or ((gx + gy) % 5 == 0 and (seed >> (gx+gy)) & 1)
             if unlocked:
                 on = on or ((idx + seed) % 4 == 0)
             if on:
-                rx = gx * cell
-                ry = gy * cell
-                rect = pygame.Rect(rx, ry, cell + 1, cell + 1)
-                pygame.draw.rect(surf, color, rect)
+                mask[i] = 1
+            i += 1
+    return mask
+
+
+_ICON_GRID = 6
+# The pattern only reads seed bits 0-10 (the XOR uses the low byte and the
+# diagonal test shifts by gx + gy <= 10), so those bits fully key a mask.
+_MASK_SEED_BITS = (1 << (2 * _ICON_GRID - 1)) - 1
+
+
+def _lookup_mask(seed: int, unlocked: bool) -> bytes:
+    """_icon_mask for the icon grid, served from _MASK_TABLE."""
+    key = (seed & _MASK_SEED_BITS, bool(unlocked))
+    mask = _MASK_TABLE.get(key)
+    if mask is None:
+        mask = _MASK_TABLE[key] = bytes(_icon_mask(_ICON_GRID, *key))
+    return mask
+
+
+# Masks for every default achievement are built at import; other ids fill in on demand.
+_MASK_TABLE: Dict[tuple, bytes] = {}
+for _seed, _color in _ICON_META.values():
+    _lookup_mask(_seed, False)
+    _lookup_mask(_seed, True)
+del _seed, _color
+
+
+def get_icon_surface(aid: str, size: int, unlocked: bool) -> 'pygame.Surface':
+    """Create a small pixel-art surface for the given achievement id.
+
+    Shared by the unlock popup and the AchievementsMenu so both draw the
+    same icons from one cache.
+    """
+    if not _PG_OK:
+        return None
+
+    key = (aid, size, bool(unlocked))
+    cached = _ICON_CACHE.get(key)
+    if cached is not None:
+        return cached
+    meta = _ICON_META.get(aid)
+    seed, color = meta if meta is not None else _icon_meta(aid)
+    if not unlocked:
+        color = (120, 120, 120)
+
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    grid = _ICON_GRID
+    cell = size // grid
+    # Build the pattern as one RGBA pixel per grid cell, then upscale it with
+    # a single nearest-neighbour scale instead of one draw call per cell.
+    on_px = bytes((*color, 255))
+    off_px = bytes(4)
+    pixels = b''.join([on_px if on else off_px for on in _lookup_mask(seed, unlocked)])
+    if cell > 0:
+        pattern = pygame.image.frombuffer(pixels, (grid, grid), 'RGBA')
+        pattern = pygame.transform.scale(pattern, (grid * cell, grid * cell))
+        # cells are drawn one pixel oversized (cell + 1), as the menu icons are
+        surf.blits([(pattern, (0, 0)), (pattern, (1, 0)), (pattern, (0, 1)), (pattern, (1, 1))],
+                   doreturn=False)
     # border
     try:
         pygame.draw.rect(surf, (40, 40, 40), (0, 0, size, size), 1)
     except Exception:
         pass
+    # match the display pixel format so the popup blits it on the fast path
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    _ICON_CACHE[key] = surf
     return surf
 
 
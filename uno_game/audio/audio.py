@@ -1,11 +1,45 @@
 # audio/audio.py
+import logging
 import os
 import pygame
 import sys
 import threading
 
+# Messages are emitted at DEBUG for routine playback; enable them with
+# logging.getLogger('uno_game.audio').setLevel(logging.DEBUG). The name is
+# fixed because the game imports this module as audio.audio, not by package.
+log = logging.getLogger('uno_game.audio')
+
+_AUDIO_EXTS = ('.mp3', '.wav', '.ogg')
+
+
+def _has_audio(path):
+    """Return True if path is a folder holding at least one playable file."""
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return False
+    try:
+        for entry in it:
+            if entry.name.lower().endswith(_AUDIO_EXTS):
+                return True
+        return False
+    finally:
+        it.close()
+
+
 # ---------------- Audio Manager ----------------
 class AudioManager:
+    # Maximum number of decoded sound effects kept in memory
+    SOUND_CACHE_SIZE = 64
+    # Mixer channels reserved for play_sound_effect, used round-robin
+    SFX_CHANNELS = 8
+    # One more reserved channel, outside that pool, for callers that pass an
+    # explicit channel_id (e.g. the intro wheel tick) so the two never collide
+    UI_CHANNEL = SFX_CHANNELS
+    # _has_audio results shared by every manager, keyed by folder path
+    _has_audio_cache = {}
+
     def __init__(self, audio_folder=None):
         """Initialize the AudioManager.
 
@@ -34,40 +68,50 @@ class AudioManager:
         self.sfx_folder = os.path.join(parent, 'sfx')
 
         # Legacy fallback: if audio_base contains files, use it as both folders
-        if os.path.exists(audio_base) and any(f.lower().endswith(('.mp3', '.wav', '.ogg')) for f in os.listdir(audio_base)):
+        found = self._has_audio_cache.get(audio_base)
+        if found is None:
+            found = self._has_audio_cache[audio_base] = _has_audio(audio_base)
+        if found:
             self.songs_folder = audio_base
             self.sfx_folder = audio_base
 
         self.audio_base = audio_base
         # master sfx volume multiplier (0.0-1.0)
         self.sfx_volume = 1.0
+        # decoded sounds keyed by path, oldest first
+        self._sound_cache = {}
+        # reserved sfx channels; empty means let pygame pick a free one
+        self._sfx_channels = []
+        self._sfx_rr = 0
 
         # Try to initialize pygame mixer. If it fails, mark unavailable but don't exit.
         self.available = True
         try:
             pygame.init()
             pygame.mixer.init()
-            pygame.mixer.set_num_channels(16)
+            pygame.mixer.set_num_channels(24)
+            pygame.mixer.set_reserved(self.SFX_CHANNELS + 1)
+            self._sfx_channels = [pygame.mixer.Channel(i) for i in range(self.SFX_CHANNELS)]
 
         except Exception as e:
-            print(f"[AudioManager] Pygame mixer init failed: {e}")
+            log.error("Pygame mixer init failed: %s", e)
             self.available = False
 
     def play_music(self, filename, loop=True, volume=0.5):
         """Play background music indefinitely or once"""
         if not self.available:
-            print("[AudioManager] Cannot play music: mixer not available")
+            log.warning("Cannot play music: mixer not available")
             return False
         music_path = os.path.join(self.songs_folder, filename)
         if not os.path.exists(music_path):
-            print(f"[AudioManager] Error: File not found: {music_path}")
+            log.error("File not found: %s", music_path)
             return False
 
         pygame.mixer.music.load(music_path)
         pygame.mixer.music.set_volume(volume)
         loops = -1 if loop else 0
         pygame.mixer.music.play(loops)
-        print(f"[AudioManager] Playing music: {filename}")
+        log.debug("Playing music: %s", filename)
         return True
 
     def stop_music(self):
@@ -75,26 +119,40 @@ class AudioManager:
         if not self.available:
             return
         pygame.mixer.music.stop()
-        print("[AudioManager] Music stopped")
+        log.debug("Music stopped")
+
+    def _load_sound(self, sound_path):
+        """Return the Sound for sound_path, decoding it only on first use."""
+        sound = self._sound_cache.get(sound_path)
+        if sound is None:
+            sound = pygame.mixer.Sound(sound_path)
+            if len(self._sound_cache) >= self.SOUND_CACHE_SIZE:
+                # evict the sound that was loaded first
+                self._sound_cache.pop(next(iter(self._sound_cache)))
+            self._sound_cache[sound_path] = sound
+        return sound
 
     def play_sound(self, filename, volume=0.5):
         """Play a short sound effect"""
         if not self.available:
-            print("[AudioManager] Cannot play sound: mixer not available")
+            log.warning("Cannot play sound: mixer not available")
             return False
         sound_path = os.path.join(self.sfx_folder, filename)
-        if not os.path.exists(sound_path):
-            print(f"[AudioManager] Error: File not found: {sound_path}")
+        if sound_path not in self._sound_cache and not os.path.exists(sound_path):
+            log.error("File not found: %s", sound_path)
             return False
 
         try:
-            sound = pygame.mixer.Sound(sound_path)
-            sound.set_volume(max(0.0, min(1.0, volume * self.sfx_volume)))
-            sound.play()
-            print(f"[AudioManager] Played sound: {filename}")
+            sound = self._load_sound(sound_path)
+            # cached sounds are shared, so set the volume on this playback's
+            # channel rather than on the Sound
+            ch = sound.play()
+            if ch is not None:
+                ch.set_volume(max(0.0, min(1.0, volume * self.sfx_volume)))
+            log.debug("Played sound: %s", filename)
             return True
         except pygame.error as e:
-            print(f"[AudioManager] Failed to play sound: {e}")
+            log.error("Failed to play sound: %s", e)
             return False
 
     def play_sound_effect(self, filename, volume=1.0, channel_id=None):
@@ -102,32 +160,55 @@ class AudioManager:
 
         - filename: name of sound file in the audio folder
         - volume: 0.0-1.0
-        - channel_id: optional mixer channel index to use; if None a free channel is used
+        - channel_id: optional mixer channel index to use (UI_CHANNEL is kept
+          free for this); if None the next idle reserved sfx channel is used
         Returns the Channel object or None on failure.
         """
         if not self.available:
-            print("[AudioManager] Cannot play SFX: mixer not available")
+            log.warning("Cannot play SFX: mixer not available")
             return None
 
         sound_path = os.path.join(self.sfx_folder, filename)
-        if not os.path.exists(sound_path):
-            print(f"[AudioManager] Error: File not found: {sound_path}")
+        if sound_path not in self._sound_cache and not os.path.exists(sound_path):
+            log.error("File not found: %s", sound_path)
             return None
 
         try:
-            sound = pygame.mixer.Sound(sound_path)
-            # apply master sfx multiplier
-            sound.set_volume(max(0.0, min(1.0, volume * self.sfx_volume)))
+            sound = self._load_sound(sound_path)
             if channel_id is not None:
                 ch = pygame.mixer.Channel(channel_id)
                 ch.play(sound)
-                return ch
+            elif self._sfx_channels:
+                ch = self._next_sfx_channel()
+                ch.play(sound)
             else:
-                return sound.play()
+                ch = sound.play()
+            # per-playback volume (the cached Sound is shared), with the
+            # master sfx multiplier applied
+            if ch is not None:
+                ch.set_volume(max(0.0, min(1.0, volume * self.sfx_volume)))
+            return ch
         except pygame.error as e:
-            print(f"[AudioManager] Failed to play SFX: {e}")
+            log.error("Failed to play SFX: %s", e)
             return None
 
+    def _next_sfx_channel(self):
+        """Next idle channel of the sfx pool, in round-robin order.
+
+        Only when every pool channel is busy is the next one in turn cut off.
+        """
+        channels = self._sfx_channels
+        n = len(channels)
+        start = self._sfx_rr
+        for k in range(n):
+            i = (start + k) % n
+            if not channels[i].get_busy():
+                break
+        else:
+            i = start
+        self._sfx_rr = (i + 1) % n
+        return channels[i]
+
     def play_sound_then_resume(self, filename, volume=1.0, fade_ms=150):
         """Pause/duck the music, play a short clip, then resume music automatically.
 
@@ -135,35 +216,25 @@ class AudioManager:
         briefly. We pause the music (not stop) so resume works correctly.
         """
         if not self.available:
-            print("[AudioManager] Cannot play clip: mixer not available")
+            log.warning("Cannot play clip: mixer not available")
             return False
 
         sound_path = os.path.join(self.sfx_folder, filename)
-        if not os.path.exists(sound_path):
-            print(f"[AudioManager] Error: File not found: {sound_path}")
+        if sound_path not in self._sound_cache and not os.path.exists(sound_path):
+            log.error("File not found: %s", sound_path)
             return False
 
         try:
             # Pause music and play sound on a free channel
             pygame.mixer.music.pause()
-            sound = pygame.mixer.Sound(sound_path)
-            sound.set_volume(volume)
+            sound = self._load_sound(sound_path)
             ch = sound.play()
 
-            # Background thread to resume music when sound finishes
-            def _wait_and_resume(channel):
-                try:
-                    while channel.get_busy():
-                        pygame.time.wait(50)
-                finally:
-                    # fade-in slightly for smoothness
-                    try:
-                        pygame.mixer.music.unpause()
-                    except Exception:
-                        pass
-
             if ch is not None:
-                t = threading.Thread(target=_wait_and_resume, args=(ch,), daemon=True)
+                ch.set_volume(volume)
+                # Single wakeup when the clip ends rather than polling the channel
+                t = threading.Timer(sound.get_length(), self._resume_music)
+                t.daemon = True
                 t.start()
                 return True
             else:
@@ -171,17 +242,25 @@ class AudioManager:
                 pygame.mixer.music.unpause()
                 return False
         except pygame.error as e:
-            print(f"[AudioManager] Failed to play clip: {e}")
+            log.error("Failed to play clip: %s", e)
             try:
                 pygame.mixer.music.unpause()
             except Exception:
                 pass
             return False
 
+    @staticmethod
+    def _resume_music():
+        """Unpause the music after a clip, ignoring a mixer that has gone away."""
+        try:
+            pygame.mixer.music.unpause()
+        except Exception:
+            pass
+
     def change_music(self, filename, loop=True, volume=None):
         """Switch the background music to a different file."""
         if not self.available:
-            print("[AudioManager] Cannot change music: mixer not available")
+            log.warning("Cannot change music: mixer not available")
             return False
         if volume is not None:
             pygame.mixer.music.set_volume(volume)
@@ -201,7 +280,7 @@ class AudioManager:
         """Set a master multiplier for SFX volume (0.0-1.0)."""
         try:
             self.sfx_volume = max(0.0, min(1.0, float(volume)))
-            print(f"[AudioManager] SFX volume set to {self.sfx_volume}")
+            log.debug("SFX volume set to %s", self.sfx_volume)
         except Exception:
             pass
 
@@ -1,18 +1,31 @@
-import turtle
 import random
 import typing
 
+if typing.TYPE_CHECKING:
+    import turtle
+
+
+_FACES = (1, 2, 3, 4, 5, 6)
+
+# Pip centres per face as (dx, dy) from the die's bottom-left corner, for the
+# 80px die drawn by draw_die (columns/rows at 25%, 50% and 75%).
+_PIP_OFFSETS = {
+    1: ((40, 40),),
+    2: ((20, 60), (60, 20)),
+    3: ((40, 40), (20, 60), (60, 20)),
+    4: ((20, 60), (60, 20), (60, 60), (20, 20)),
+    5: ((40, 40), (20, 60), (60, 20), (60, 60), (20, 20)),
+    6: ((20, 60), (60, 20), (60, 60), (20, 20), (20, 40), (60, 40)),
+}
+
 
 def create_dice_rolls(num_dice: int) -> typing.List[typing.Dict]:
     """Creates and returns a list of random dice rolls."""
-    rolls = []
-    for _ in range(num_dice):
-        value = random.randint(1, 6)
-        rolls.append({'value': value})
-    return rolls
+    # one random.choices call instead of a randint per die
+    return [{'value': value} for value in random.choices(_FACES, k=num_dice)]
 
 
-def draw_die(pen: turtle.Turtle, x: int, y: int, die: typing.Dict):
+def draw_die(pen: 'turtle.Turtle', x: int, y: int, die: typing.Dict):
     """
     Draws a single game die at a specific location using a given turtle pen.
     - pen: The turtle object to use for drawing.
@@ -35,42 +48,54 @@ def draw_die(pen: turtle.Turtle, x: int, y: int, die: typing.Dict):
     pen.penup()
 
     # --- Helper function to draw a single pip (dot) ---
+    # A single dot() is one canvas item, where a filled circle() is traced
+    # segment by segment.
     def draw_pip(pip_x, pip_y):
-        pen.goto(pip_x, pip_y - pip_radius)  # Go to bottom of circle
-        pen.pendown()
-        pen.color('black', 'black')
-        pen.begin_fill()
-        pen.circle(pip_radius)
-        pen.end_fill()
-        pen.penup()
-
-    # --- Calculate pip positions based on the die's value ---
-    val = die.get('value')
-
-    # Pre-calculate common coordinates based on die size
-    col_1 = x + die_size * 0.25
-    col_2 = x + die_size * 0.50
-    col_3 = x + die_size * 0.75
-    row_1 = y + die_size * 0.75
-    row_2 = y + die_size * 0.50
-    row_3 = y + die_size * 0.25
-
-    # Use a more efficient structure to draw pips shared by multiple values
-    if val in [1, 3, 5]:
-        draw_pip(col_2, row_2)  # Center pip
-    if val in [2, 3, 4, 5, 6]:
-        draw_pip(col_1, row_1)  # Top-left
-        draw_pip(col_3, row_3)  # Bottom-right
-    if val in [4, 5, 6]:
-        draw_pip(col_3, row_1)  # Top-right
-        draw_pip(col_1, row_3)  # Bottom-left
-    if val == 6:
-        draw_pip(col_1, row_2)  # Middle-left
-        draw_pip(col_3, row_2)  # Middle-right
+        pen.goto(pip_x, pip_y)  # Centre of the pip
+        pen.dot(pip_radius * 2, 'black')
 
+    # --- Draw the pips for the die's value ---
+    for dx, dy in _PIP_OFFSETS.get(die.get('value'), ()):
+        draw_pip(x + dx, y + dy)
+
+
+def draw_die_pygame(surface, x: int, y: int, die: typing.Dict):
+    """
+    pygame counterpart of draw_die: same 80px die and pips, two draw calls
+    for the body plus one circle per pip.
+    - x, y: The top-left corner of the die on `surface`.
+    """
+    import pygame
+
+    die_size = 80
+    pip_radius = 8
+    rect = pygame.Rect(int(x), int(y), die_size, die_size)
+    pygame.draw.rect(surface, (255, 255, 255), rect)
+    pygame.draw.rect(surface, (0, 0, 0), rect, 1)
+    # offsets are measured up from the bottom edge, as in turtle
+    for dx, dy in _PIP_OFFSETS.get(die.get('value'), ()):
+        pygame.draw.circle(surface, (0, 0, 0), (rect.x + dx, rect.bottom - dy), pip_radius)
+
+
+def _demo_layout(dice: typing.List[typing.Dict]):
+    """Yield (x, y, die) with turtle coordinates (origin centre, y up) of each bottom-left corner."""
+    die_spacing = 100
+    start_x = - (4.5 * die_spacing) / 2  # Center the rows
+    start_y_top_row = 100
+    start_y_bottom_row = -50
+    for i, die in enumerate(dice):
+        if i < 5:
+            # First row
+            yield start_x + (i * die_spacing), start_y_top_row, die
+        else:
+            # Second row
+            yield start_x + ((i - 5) * die_spacing), start_y_bottom_row, die
+
+
+def _run_turtle_demo(dice: typing.List[typing.Dict]):
+    # turtle pulls in tkinter, so only the demo pays for importing it
+    import turtle
 
-if __name__ == "__main__":
-    # --- Main Script (turtle demo) ---
     screen = turtle.Screen()
     screen.setup(width=900, height=600)
     screen.bgcolor("#1C522E")  # A nice dark green for a game table
@@ -81,30 +106,45 @@ if __name__ == "__main__":
     main_pen.hideturtle()
     main_pen.speed(0)
 
-    # Generate 10 random dice rolls
-    dice_to_draw = create_dice_rolls(10)
+    for die_x, die_y, die in _demo_layout(dice):
+        draw_die(main_pen, die_x, die_y, die)
 
-    # --- Define layout for drawing the dice ---
-    die_spacing = 100
-    start_x = - (4.5 * die_spacing) / 2  # Center the rows
-    start_y_top_row = 100
-    start_y_bottom_row = -50
+    screen.update()
+    screen.exitonclick()
 
-    print(f"Drawing {len(dice_to_draw)} dice...")
 
-    for i, die_to_draw in enumerate(dice_to_draw):
-        if i < 5:
-            # First row
-            die_x = start_x + (i * die_spacing)
-            die_y = start_y_top_row
-        else:
-            # Second row
-            die_x = start_x + ((i - 5) * die_spacing)
-            die_y = start_y_bottom_row
+def _run_pygame_demo(dice: typing.List[typing.Dict]):
+    import pygame
 
-        draw_die(main_pen, die_x, die_y, die_to_draw)
+    pygame.init()
+    width, height = 900, 600
+    screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption("Dice Game")
+    screen.fill((0x1C, 0x52, 0x2E))  # A nice dark green for a game table
+    for die_x, die_y, die in _demo_layout(dice):
+        # turtle's centred, y-up bottom-left corner -> pygame top-left
+        draw_die_pygame(screen, width // 2 + die_x, height // 2 - die_y - 80, die)
+    pygame.display.flip()
 
-    screen.update()
+    # the scene is static: just wait for a click or close, like exitonclick()
+    while True:
+        event = pygame.event.wait()
+        if event.type in (pygame.QUIT, pygame.MOUSEBUTTONDOWN):
+            break
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    # --- Main Script (dice demo) ---
+    # Generate 10 random dice rolls
+    dice_to_draw = create_dice_rolls(10)
+    print(f"Drawing {len(dice_to_draw)} dice...")
 
-    
-    screen.exitonclick()
\ No newline at end of file
+    # pygame draws a die body in two calls where turtle traces it segment by
+    # segment; keep turtle for machines without pygame
+    try:
+        import pygame  # noqa: F401
+    except ImportError:
+        _run_turtle_demo(dice_to_draw)
+    else:
+        _run_pygame_demo(dice_to_draw)
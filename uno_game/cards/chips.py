@@ -12,18 +12,48 @@ DEFAULT_COLORS = [
     (80, 40, 10),    # brown
     (160, 120, 40),  # gold/yellow
 ]
+# Nominal value of each DEFAULT_COLORS entry, by index
+DEFAULT_DENOMS = (50, 25, 100, 5, 10)
 
 _chip_cache: Dict[Tuple[Tuple[int,int,int], int], pygame.Surface] = {}
+# Drop shadows and the dark "+N" overflow chip, keyed by radius
+_shadow_cache: Dict[int, pygame.Surface] = {}
+_overflow_chip_cache: Dict[int, pygame.Surface] = {}
+# Default stack fonts keyed by size, and rendered labels keyed by (font, text, color)
+_font_cache: Dict[int, pygame.font.Font] = {}
+_label_cache: Dict[tuple, pygame.Surface] = {}
+_LABEL_CACHE_MAX = 256
+
+def _to_display_format(surf: pygame.Surface) -> pygame.Surface:
+    # cached chip surfaces are blitted every frame; once a display exists,
+    # store them in its pixel format so blits skip the conversion
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha()
 
-def _get_fancy_chip(color: Tuple[int,int,int], radius: int) -> pygame.Surface:
-    key = (color, radius)
-    if key in _chip_cache:
-        return _chip_cache[key]
 
+def _fancy_chip_pixels(color: Tuple[int,int,int], radius: int) -> bytearray:
+    """BGRA pixels of a (radius*2 + 8) square chip, without the denomination.
+
+    BGRA is the byte order of a default SRCALPHA surface, so the buffer
+    becomes a surface that blits without conversion.
+    """
     size = radius*2 + 8
-    surf = pygame.Surface((size, size), pygame.SRCALPHA)
     cx, cy = size//2, size//2
     r = radius
+    buf = bytearray(size * size * 4)
+
+    def px_bytes(r, g, b, a=255):
+        return bytes((b, g, r, a))
+
+    def put(px, py, pixel):
+        i = (py*size + px) * 4
+        buf[i:i+4] = pixel
+
+    def span(py, x0, x1, pixel):
+        # fill x0..x1 (inclusive) of row py in one slice assignment
+        i = (py*size + x0) * 4
+        buf[i:i + (x1-x0+1)*4] = pixel * (x1-x0+1)
 
     rim_base = (212, 175, 55)
     rim_dark = (140, 110, 30)
@@ -31,57 +61,88 @@ def _get_fancy_chip(color: Tuple[int,int,int], radius: int) -> pygame.Surface:
 
     # Rim gradient
     for yy in range(-r, r+1):
-        for xx in range(-r, r+1):
-            dist = (xx*xx + yy*yy)**0.5
-            if r-1 <= dist <= r:
-                t = (yy + r)/(2*r)
-                cr = int(rim_base[0] + (rim_dark[0]-rim_base[0])*t)
-                cg = int(rim_base[1] + (rim_dark[1]-rim_base[1])*t)
-                cb = int(rim_base[2] + (rim_dark[2]-rim_base[2])*t)
-                surf.set_at((cx+xx, cy+yy), (cr, cg, cb, 255))
+        t = (yy + r)/(2*r)
+        rim_px = px_bytes(int(rim_base[0] + (rim_dark[0]-rim_base[0])*t),
+                          int(rim_base[1] + (rim_dark[1]-rim_base[1])*t),
+                          int(rim_base[2] + (rim_dark[2]-rim_base[2])*t))
+        # pixels with r-1 <= dist <= r, compared on squared distances
+        hi = r*r - yy*yy
+        lo = (r-1)*(r-1) - yy*yy
+        x1 = math.isqrt(hi)
+        x0 = math.isqrt(lo - 1) + 1 if lo > 0 else 0
+        span(cy+yy, cx-x1, cx-x0, rim_px)
+        span(cy+yy, cx+x0, cx+x1, rim_px)
 
     # Specular highlight arc
+    light_px = px_bytes(*rim_light)
     for ang_deg in range(-40, 41, 3):
         ang = math.radians(ang_deg)
         hx = int(cx + math.cos(ang)*r)
         hy = int(cy - math.sin(ang)*r*0.85)
         if 0 <= hx < size and 0 <= hy < size:
-            surf.set_at((hx, hy), rim_light)
+            put(hx, hy, light_px)
 
     # Stripe segments
+    stripe_px = px_bytes(245, 245, 245)
     stripe_count = 8
     stripe_w = max(1, r//6)
     stripe_r0 = r-1
     stripe_r1 = r - max(2, r//4)
+    # one (cos, sin) per stripe ray, shared by every radius along it
+    rays = []
     for i in range(stripe_count):
         a0 = (2*math.pi*i)/stripe_count
+        for sw in range(-stripe_w, stripe_w+1):
+            ang = a0 + (sw/(stripe_w*4))
+            rays.append((math.cos(ang), math.sin(ang)))
+    for ca, sa in rays:
         for rr in range(stripe_r1, stripe_r0+1):
-            for sw in range(-stripe_w, stripe_w+1):
-                ang = a0 + (sw/(stripe_w*4))
-                px = int(cx + math.cos(ang)*rr)
-                py = int(cy + math.sin(ang)*rr)
-                if 0 <= px < size and 0 <= py < size:
-                    surf.set_at((px, py), (245,245,245,255))
+            px = int(cx + ca*rr)
+            py = int(cy + sa*rr)
+            if 0 <= px < size and 0 <= py < size:
+                put(px, py, stripe_px)
 
     # Inner disk with radial darkening
     inner_r = int(r*0.78)
+    shade_px = {}  # squared distance -> pixel; the disk repeats each many times
     for yy in range(-inner_r, inner_r+1):
-        for xx in range(-inner_r, inner_r+1):
-            dist = (xx*xx + yy*yy)**0.5
-            if dist <= inner_r:
-                t = dist/inner_r
+        x1 = math.isqrt(inner_r*inner_r - yy*yy)
+        row = []
+        for xx in range(-x1, x1+1):
+            d2 = xx*xx + yy*yy
+            pixel = shade_px.get(d2)
+            if pixel is None:
+                t = d2**0.5/inner_r
                 darken = 0.35*t
-                cr = int(color[0]*(1-darken))
-                cg = int(color[1]*(1-darken))
-                cb = int(color[2]*(1-darken))
-                surf.set_at((cx+xx, cy+yy), (cr,cg,cb,255))
+                pixel = shade_px[d2] = px_bytes(int(color[0]*(1-darken)),
+                                                int(color[1]*(1-darken)),
+                                                int(color[2]*(1-darken)))
+            row.append(pixel)
+        i = ((cy+yy)*size + cx-x1) * 4
+        buf[i:i + len(row)*4] = b''.join(row)
 
     # Center highlight
+    center_px = px_bytes(250, 250, 250, 200)
     center_r = max(2, int(r*0.22))
     for yy in range(-center_r, center_r+1):
-        for xx in range(-center_r, center_r+1):
-            if xx*xx + yy*yy <= center_r*center_r:
-                surf.set_at((cx+xx, cy+yy), (250,250,250,200))
+        x1 = math.isqrt(center_r*center_r - yy*yy)
+        span(cy+yy, cx-x1, cx+x1, center_px)
+
+    return buf
+
+
+def _get_fancy_chip(color: Tuple[int,int,int], radius: int) -> pygame.Surface:
+    key = (color, radius)
+    cached = _chip_cache.get(key)
+    if cached is not None:
+        return cached
+
+    size = radius*2 + 8
+    cx, cy = size//2, size//2
+    r = radius
+    # all pixel work happens in one buffer; copy() so the surface owns it
+    buf = _fancy_chip_pixels(color, radius)
+    surf = pygame.image.frombuffer(buf, (size, size), 'BGRA').copy()
 
     # Denomination text (map color to nominal value)
     denom_map = {
@@ -101,22 +162,71 @@ def _get_fancy_chip(color: Tuple[int,int,int], radius: int) -> pygame.Surface:
         except Exception:
             pass
 
+    surf = _to_display_format(surf)
     _chip_cache[key] = surf
     return surf
 
 
-def _choose_color(count: int) -> Tuple[int, int, int]:
-    # Choose a color based on magnitude so stacks look varied
-    return DEFAULT_COLORS[(count // 5) % len(DEFAULT_COLORS)]
+def _get_shadow(radius: int) -> pygame.Surface:
+    shadow = _shadow_cache.get(radius)
+    if shadow is None:
+        size = radius*2 + 8
+        shadow = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(shadow, (0,0,0,90), (size//2 + 2, size//2 + 4), radius)
+        shadow = _shadow_cache[radius] = _to_display_format(shadow)
+    return shadow
+
+
+def _get_overflow_chip(radius: int) -> pygame.Surface:
+    # darker fancy chip without stripes for overflow indicator
+    ov = _overflow_chip_cache.get(radius)
+    if ov is None:
+        ov = pygame.Surface((radius*2+8, radius*2+8), pygame.SRCALPHA)
+        pygame.draw.circle(ov, (40,40,40), (ov.get_width()//2, ov.get_height()//2), radius)
+        pygame.draw.circle(ov, (0,0,0), (ov.get_width()//2, ov.get_height()//2), radius, 2)
+        ov = _overflow_chip_cache[radius] = _to_display_format(ov)
+    return ov
+
+
+def _get_font(size: int):
+    font = _font_cache.get(size)
+    if font is None:
+        try:
+            font = pygame.font.SysFont('Arial', size)
+        except Exception:
+            return None
+        _font_cache[size] = font
+    return font
+
+
+def _render_label(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    key = (font, text, color)
+    lab = _label_cache.get(key)
+    if lab is None:
+        if len(_label_cache) >= _LABEL_CACHE_MAX:
+            _label_cache.clear()
+        lab = _label_cache[key] = font.render(text, True, color)
+    return lab
+
+
+# sin/cos of each chip's phase offset in the stack bob/sway animation,
+# [(sin(i*0.55), cos(i*0.55), sin(i*0.33), cos(i*0.33)), ...], grown on demand
+_wobble_table: list = []
+
+
+def _get_wobble_table(n: int) -> list:
+    while len(_wobble_table) < n:
+        i = len(_wobble_table)
+        _wobble_table.append((math.sin(i * 0.55), math.cos(i * 0.55),
+                              math.sin(i * 0.33), math.cos(i * 0.33)))
+    return _wobble_table
 
 
 def draw_chip(surface: pygame.Surface, cx: int, cy: int, radius: int, color: Tuple[int, int, int]):
     base = _get_fancy_chip(color, radius)
     rect = base.get_rect(center=(int(cx), int(cy)))
     # drop shadow
-    shadow = pygame.Surface(rect.size, pygame.SRCALPHA)
-    pygame.draw.circle(shadow, (0,0,0,90), (shadow.get_width()//2 + 2, shadow.get_height()//2 + 4), radius)
-    surface.blit(shadow, (rect.x, rect.y))
+    surface.blit(_get_shadow(radius), (rect.x, rect.y))
     surface.blit(base, rect)
 
 
@@ -130,6 +240,8 @@ def draw_chip_stack(surface: pygame.Surface, x: int, y: int, count: int, *,
     - x, y: top-left position of the stack area (chips are drawn to the right of this)
     - count: number of chips to represent
     - chip_radius: radius of each chip token
+    - y_spacing: how much less than a radius each chip is raised over the one below
+    - x_spacing: unused, kept so existing keyword callers keep working
     - max_display: maximum number of chip tokens to actually draw; if count > max_display,
       a "+N" label will be shown indicating the remaining chips.
     
@@ -143,65 +255,70 @@ def draw_chip_stack(surface: pygame.Surface, x: int, y: int, count: int, *,
           }
     """
     if font is None:
-        try:
-            font = pygame.font.SysFont('Arial', 14)
-        except Exception:
-            font = None
+        font = _get_font(14)
 
     # compute layout
     max_draw = min(count, max_display)
     # draw chips slightly staggered to look like a real stack
     cx = x + chip_radius
     cy = y + chip_radius
+    # vertical step between chips; the bottom (first drawn) chip sits at base_y
+    dy = chip_radius - y_spacing
+    base_y = cy + (max_draw - 1) * dy
+
+    # Tally of drawn chips per DEFAULT_COLORS index
+    n_colors = len(DEFAULT_COLORS)
+    color_counts = [0] * n_colors
 
-    # Build denominations mapping
-    denominations = {}
-    denom_values = {
-        (180,30,30): 50,   # red
-        (30,90,30): 25,    # green
-        (40,40,120): 100,  # blue
-        (80,40,10): 5,     # brown
-        (160,120,40): 10   # gold
-    }
-    
     # stack upwards (later chips drawn on top)
     # animation phase
     phase = (time_ms / 1000.0) if time_ms is not None else 0.0
+    # sin(a + b) = sin(a)cos(b) + cos(a)sin(b): two sin/cos pairs per frame,
+    # the per-chip terms come from the table
+    bob_s, bob_c = math.sin(phase * 2.7), math.cos(phase * 2.7)
+    sway_s, sway_c = math.sin(phase * 1.9), math.cos(phase * 1.9)
+    wobble = _get_wobble_table(max_draw)
+    shadow = _get_shadow(chip_radius)
+    # every shadow/chip/label goes into one blits() call, in draw order
+    seq = []
     for i in range(max_draw):
-        offset = (max_draw - 1 - i) * (chip_radius - y_spacing)
-        color = _choose_color(count - i)
-        # Count this chip in denominations
-        value = denom_values.get(color, 0)
-        denominations[value] = denominations.get(value, 0) + 1
+        # color by magnitude so stacks look varied
+        color_idx = ((count - i) // 5) % n_colors
+        color = DEFAULT_COLORS[color_idx]
+        color_counts[color_idx] += 1
         # subtle bob + horizontal sway
-        bob = math.sin(phase * 2.7 + i * 0.55) * 1.5
-        sway = math.sin(phase * 1.9 + i * 0.33) * 1.2
-        draw_chip(surface, cx + sway, cy + offset + bob, chip_radius, color)
+        si_b, ci_b, si_s, ci_s = wobble[i]
+        bob = (bob_s * ci_b + bob_c * si_b) * 1.5
+        sway = (sway_s * ci_s + sway_c * si_s) * 1.2
+        base = _get_fancy_chip(color, chip_radius)
+        rect = base.get_rect(center=(int(cx + sway), int(base_y - i * dy + bob)))
+        seq.append((shadow, rect.topleft))
+        seq.append((base, rect))
 
     # If there's overflow, draw a label on top
     overflow = count - max_draw
     if overflow > 0:
         # draw a small darker chip on top and number
         top_x = cx
-        top_y = cy - (max_draw - 1) * (chip_radius - y_spacing)
-        # darker fancy chip without stripes for overflow indicator
-        ov = pygame.Surface((chip_radius*2+8, chip_radius*2+8), pygame.SRCALPHA)
-        pygame.draw.circle(ov, (40,40,40), (ov.get_width()//2, ov.get_height()//2), chip_radius)
-        pygame.draw.circle(ov, (0,0,0), (ov.get_width()//2, ov.get_height()//2), chip_radius, 2)
-        surface.blit(ov, (top_x - ov.get_width()//2, top_y - ov.get_height()//2))
+        top_y = cy - (max_draw - 1) * dy
+        ov = _get_overflow_chip(chip_radius)
+        seq.append((ov, (top_x - ov.get_width()//2, top_y - ov.get_height()//2)))
         if font:
-            lab = font.render(f'+{overflow}', True, (255, 255, 255))
-            lr = lab.get_rect(center=(top_x, top_y))
-            surface.blit(lab, lr)
+            lab = _render_label(font, f'+{overflow}', (255, 255, 255))
+            seq.append((lab, lab.get_rect(center=(top_x, top_y))))
 
     # render numeric count to the right of stack for clarity
     if font:
-        txt = font.render(str(count), True, (230, 230, 230))
-        surface.blit(txt, (x + chip_radius * 2 + 6, y))
+        txt = _render_label(font, str(count), (230, 230, 230))
+        seq.append((txt, (x + chip_radius * 2 + 6, y)))
+    surface.blits(seq, doreturn=False)
+
+    # Build denominations mapping
+    denominations = {DEFAULT_DENOMS[j]: n for j, n in enumerate(color_counts) if n}
 
-    text_w = font.size(str(count))[0] if font else 24
+    text_w = txt.get_width() if font else 24
     width = chip_radius * 2 + 6 + text_w
-    height = chip_radius * 2 + (max_draw - 1) * (chip_radius - y_spacing)
+    height = chip_radius * 2 + (max_draw - 1) * dy
     rect = pygame.Rect(x, y, int(width), int(max(2 * chip_radius, height)))
     
     metadata = {
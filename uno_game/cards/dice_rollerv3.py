@@ -1,10 +1,5 @@
 import os
 import sys
-import os
-# Ensure uno_game directory itself is in sys.path for imports
-uno_game_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if uno_game_dir not in sys.path:
-    sys.path.insert(0, uno_game_dir)
 # DirectGUI shop/inventory removed — keep file focused on the dice simulator
 import random
 import math
@@ -13,10 +8,12 @@ from direct.showbase.ShowBase import ShowBase
 from panda3d.core import (
     Vec3, Point3, LColor, Plane,
     BitMask32, CardMaker, NodePath, 
-    Texture, PNMImage, TransparencyAttrib,
+    Texture, TransparencyAttrib,
     DirectionalLight, AmbientLight,
     Material, AntialiasAttrib, TextNode,
-    Filename, loadPrcFileData, LineSegs,
+    Filename, loadPrcFileData, LineSegs, TransformState,
+    Geom, GeomNode, GeomTriangles,
+    GeomVertexData, GeomVertexFormat, GeomVertexWriter,
 )
 
 # `globalClock` is sometimes exported differently depending on the Panda3D build.
@@ -53,6 +50,24 @@ DIE_SIZE = 0.8
 FRICTION_FELT = 0.9     
 BOUNCINESS = 0.5        
 DAMPING_ANGULAR = 0.5   
+# Swept (CCD) collision only for steps that move a die more than half its
+# half-extent; slower steps cannot tunnel through the walls or floor
+CCD_MOTION_THRESHOLD = DIE_SIZE * 0.5
+SETTLE_SPEED = 0.1      # summed linear + angular speed below which the dice are scored
+SETTLE_CHECK_INTERVAL = 0.05  # seconds between settle checks; score text lags by at most this
+# Consecutive slow checks needed before scoring, so a die that is momentarily
+# still (just respawned in mid-air, or at the top of a bounce) is not frozen
+SETTLE_CHECKS = 4
+# Held dice stay this far from the table centre (uses PHYSICS DIMENSIONS)
+DRAG_BOUNDS_X = (TABLE_WIDTH_PHYSICS / 2.0) - DIE_SIZE
+DRAG_BOUNDS_Y = (TABLE_DEPTH_PHYSICS / 2.0) - DIE_SIZE
+
+# --- PHYSICS STEPPING ---
+# 120 Hz is plenty for a couple of boxes; 4 substeps still covers a 30 fps frame
+PHYSICS_STEP = 1.0 / 120.0
+PHYSICS_MAX_SUBSTEPS = 4
+# Longest frame simulated in full; time beyond it (window drags, hitches) is dropped
+MAX_FRAME_DT = PHYSICS_MAX_SUBSTEPS * PHYSICS_STEP
 
 # --- ASSETS ---
 FOLDER_NAME = "dice"
@@ -61,9 +76,25 @@ TABLE_FILE_NAME = "poker-table.glb"
 DICE_MODEL_SCALE = 10.0 
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Generated face textures are written here on first run and loaded afterwards.
+# Bump FACE_CACHE_VERSION whenever the face generator changes so old files are ignored.
+FACE_CACHE_DIR = os.path.join(SCRIPT_DIR, FOLDER_NAME, "faces")
+FACE_CACHE_VERSION = 1
 
 # --- SCORING CALIBRATION ---
 DIE_AXIS_MAPPING = { "UP": 4, "DOWN": 3, "RIGHT": 2, "LEFT": 1, "FWD": 5, "BACK": 6 }
+# (face number, position, hpr) of each side of the procedural fallback die
+DIE_FACES = [
+    (1, Vec3(0,0,DIE_SIZE), Vec3(0,-90,0)), (6, Vec3(0,0,-DIE_SIZE), Vec3(0,90,0)),
+    (2, Vec3(0,-DIE_SIZE,0), Vec3(0,0,0)), (5, Vec3(0,DIE_SIZE,0), Vec3(180,0,180)),
+    (3, Vec3(-DIE_SIZE,0,0), Vec3(90,0,0)), (4, Vec3(DIE_SIZE,0,0), Vec3(-90,0,0))
+]
+# (face when the axis points up, face when it points down) for local X, Y, Z
+_AXIS_FACES = (
+    (DIE_AXIS_MAPPING["RIGHT"], DIE_AXIS_MAPPING["LEFT"]),
+    (DIE_AXIS_MAPPING["FWD"], DIE_AXIS_MAPPING["BACK"]),
+    (DIE_AXIS_MAPPING["UP"], DIE_AXIS_MAPPING["DOWN"]),
+)
 
 # --- LIBRARY CHECK ---
 # ShopInventoryUI intentionally removed per user request
@@ -75,45 +106,87 @@ except ImportError:
     sys.exit()
 
 # --- PROCEDURAL TEXTURE ---
-def create_die_face_texture(number, size=512): 
-    image = PNMImage(size, size)
-    image.fill(0.96, 0.94, 0.90) 
-    for x in range(size):
-        for y in range(size):
-            d = min(x, y, size-x, size-y)
-            if d < 40:
-                f = d / 40.0
-                v = 0.7 + (0.3 * f)
-                bg = image.getXel(x, y)
-                image.setXel(x, y, bg[0]*v, bg[1]*v, bg[2]*v)
-    pips = []
-    c, l, r = 0.5, 0.22, 0.78 
-    if number==1: pips=[(c,c)]
-    elif number==2: pips=[(l,r),(r,l)]
-    elif number==3: pips=[(l,r),(c,c),(r,l)]
-    elif number==4: pips=[(l,l),(l,r),(r,l),(r,r)]
-    elif number==5: pips=[(l,l),(l,r),(r,l),(r,r),(c,c)]
-    elif number==6: pips=[(l,l),(l,r),(r,l),(r,r),(l,c),(r,c)]
+FACE_COLOR = (0.96, 0.94, 0.90)
+FACE_EDGE = 40  # width of the darkened border, in texels
+_c, _l, _r = 0.5, 0.22, 0.78
+PIP_LAYOUTS = {
+    1: [(_c,_c)],
+    2: [(_l,_r),(_r,_l)],
+    3: [(_l,_r),(_c,_c),(_r,_l)],
+    4: [(_l,_l),(_l,_r),(_r,_l),(_r,_r)],
+    5: [(_l,_l),(_l,_r),(_r,_l),(_r,_r),(_c,_c)],
+    6: [(_l,_l),(_l,_r),(_r,_l),(_r,_r),(_l,_c),(_r,_c)],
+}
+
+def _face_texel(v):
+    return bytes(int(ch * v * 255 + 0.5) for ch in FACE_COLOR)
+
+def _face_rows(number, size):
+    # Built as raw RGB rows instead of size*size PNMImage.setXel calls: the
+    # border shade only depends on the distance to the nearest edge, so every
+    # row is one of FACE_EDGE + 1 patterns and only the pip squares need
+    # per-texel work.
+    edge = [min(x, size-x) for x in range(size)]
+    texels = [_face_texel(0.7 + 0.3 * d / FACE_EDGE) for d in range(FACE_EDGE)] + [_face_texel(1.0)]
+    patterns = {}
+    rows = []
+    for y in range(size):
+        ry = min(y, size-y, FACE_EDGE)
+        row = patterns.get(ry)
+        if row is None:
+            row = patterns[ry] = b''.join(texels[min(d, ry)] for d in edge)
+        rows.append(row)
+
     rad = size * 0.10 
-    for px, py in pips:
+    # squared radii: only the 2px antialiased rim needs a sqrt
+    r2, solid2 = rad * rad, (rad - 2.0) * (rad - 2.0)
+    for px, py in PIP_LAYOUTS.get(number, ()):
         cx, cy = int(px*size), int(py*size)
         min_x, max_x = max(0, int(cx-rad)), min(size, int(cx+rad))
         min_y, max_y = max(0, int(cy-rad)), min(size, int(cy+rad))
-        for x in range(min_x, max_x):
-            for y in range(min_y, max_y):
-                dist = math.sqrt((x-cx)**2 + (y-cy)**2)
-                if dist < rad:
-                    a = 1.0
-                    if dist > rad - 2.0: a = (rad - dist) / 2.0
-                    bg = image.getXel(x, y)
-                    inv = 1.0 - a
-                    image.setXel(x, y, bg[0]*inv, bg[1]*inv, bg[2]*inv)
+        for y in range(min_y, max_y):
+            row = rows[y] = bytearray(rows[y])
+            dy2 = (y-cy) * (y-cy)
+            for x in range(min_x, max_x):
+                d2 = (x-cx) * (x-cx) + dy2
+                if d2 >= r2:
+                    continue
+                i = x * 3
+                if d2 <= solid2:
+                    row[i:i+3] = b'\0\0\0'
+                    continue
+                inv = 1.0 - (rad - math.sqrt(d2)) / 2.0
+                for j in range(i, i + 3):
+                    row[j] = int(row[j] * inv + 0.5)
+    return rows
+
+# The six faces fill a 3x2 grid; a blank fourth column keeps the atlas a power of two
+ATLAS_COLS, ATLAS_ROWS = 4, 2
+
+def _atlas_cell(number):
+    # (column, row) of a face in the atlas, row 0 at the top
+    return (number - 1) % 3, (number - 1) // 3
+
+def create_die_face_atlas(size=512):
+    faces = [_face_rows(n, size) for n in range(1, 7)]
+    pad = bytes(3 * size * (ATLAS_COLS - 3))
+    rows = []
+    for r in range(ATLAS_ROWS):
+        cells = faces[r*3:r*3 + 3]
+        rows.extend(b''.join(cell[y] for cell in cells) + pad for y in range(size))
     t = Texture()
-    t.load(image)
-    t.setMinfilter(Texture.FTLinearMipmapLinear)
-    t.setMagfilter(Texture.FTLinear)
+    t.setup2dTexture(size * ATLAS_COLS, size * ATLAS_ROWS, Texture.T_unsigned_byte, Texture.F_rgb)
+    # RAM images start at the bottom row
+    t.setRamImageAs(b''.join(reversed(rows)), 'RGB')
+    _set_face_filters(t)
     return t
 
+def _set_face_filters(t):
+    # Plain linear filtering: a non-mipmap min filter means Panda never builds
+    # (or keeps in VRAM) a mipmap chain for the faces
+    t.setMinfilter(Texture.FTLinear)
+    t.setMagfilter(Texture.FTLinear)
+
 class DiceSimulator(ShowBase):
     def __init__(self):
         ShowBase.__init__(self)
@@ -143,15 +216,24 @@ class DiceSimulator(ShowBase):
         self.render.setLight(self.render.attachNewNode(alight))
 
         # Scene
-        self.face_textures = {i: create_die_face_texture(i) for i in range(1, 7)}
         self.create_poker_table()
         self.dice = []
+        self.dice_nps = []  # NodePath of each body in self.dice, same order
+        # Dice are never scaled, so one collision shape serves them all; it is
+        # shared, so never resize or otherwise modify it
+        self.die_shape = BulletBoxShape(Vec3(DIE_SIZE, DIE_SIZE, DIE_SIZE))
+        self.fallback_die = None  # built on first use if the dice model is missing
         
         # Interaction
         self.holding_dice = False
+        # None until the next settle check, so the first result always updates the text
+        self.at_rest = None
+        self.slow_checks = 0
         self.drag_plane = Plane(Vec3(0, 0, 1), Point3(0, 0, 6))
         self.last_mouse_pos_3d = Point3(0, 0, 0)
         self.mouse_velocity = Vec3(0, 0, 0)
+        # Scratch points for the per-frame mouse ray, filled in place
+        self._ray_from = Point3(); self._ray_to = Point3(); self._ray_hit = Point3()
 
         # Controls
         self.accept('space', self.reset_position)
@@ -167,20 +249,46 @@ class DiceSimulator(ShowBase):
 
         self.spawn_dice()
         self.taskMgr.add(self.update, 'update')
+        self.taskMgr.doMethodLater(SETTLE_CHECK_INTERVAL, self.update_score, 'update_score')
 
         
 
+    def load_face_atlas(self, size=512):
+        path = os.path.join(FACE_CACHE_DIR, f"atlas_v{FACE_CACHE_VERSION}_{size}.png")
+        if os.path.exists(path):
+            try:
+                t = self.loader.loadTexture(Filename.fromOsSpecific(path))
+                _set_face_filters(t)
+                return t
+            except Exception:
+                print(f"Face texture cache unreadable, regenerating: {path}")
+        t = create_die_face_atlas(size)
+        try:
+            os.makedirs(FACE_CACHE_DIR, exist_ok=True)
+            if not t.write(Filename.fromOsSpecific(path)):
+                print(f"Could not cache face texture: {path}")
+        except OSError as e:
+            print(f"Could not cache face texture: {e}")
+        return t
+
     def spawn_dice(self):
         for i in range(2):
             pos = Point3(-1.5 + (i * 3.0), 0, 2.0)
             self.create_die_body(pos)
+        # Bodies enter the world only once all of them are fully set up and placed
+        for body in self.dice:
+            self.world.attachRigidBody(body)
+        # Where each die sits relative to the cursor while held
+        self.drag_offsets = [Vec3(-0.8 + (i*1.6), 0, 0) for i in range(len(self.dice))]
 
     def reset_position(self):
         self.holding_dice = False
-        for i, body in enumerate(self.dice):
+        self.at_rest = None
+        self.slow_checks = 0
+        for i, (body, np) in enumerate(zip(self.dice, self.dice_nps)):
+            body.setActive(True)
             body.setLinearVelocity(Vec3(0,0,0))
             body.setAngularVelocity(Vec3(0,0,0))
-            np = NodePath(body)
             np.setPos(-1.5 + (i * 3.0), 0, 5.0)
             np.setHpr(random.uniform(0,360), random.uniform(0,360), random.uniform(0,360))
 
@@ -188,22 +296,25 @@ class DiceSimulator(ShowBase):
     def get_mouse_in_world(self):
         if not self.mouseWatcherNode.hasMouse(): return None
         mpos = self.mouseWatcherNode.getMouse()
-        p_from = Point3(); p_to = Point3()
+        p_from, p_to = self._ray_from, self._ray_to
         self.camLens.extrude(mpos, p_from, p_to)
         p_from = self.render.getRelativePoint(self.cam, p_from)
         p_to = self.render.getRelativePoint(self.cam, p_to)
-        intersection = Point3()
-        if self.drag_plane.intersectsLine(intersection, p_from, p_to):
-            return intersection
+        if self.drag_plane.intersectsLine(self._ray_hit, p_from, p_to):
+            # callers keep and modify the result, so hand out a copy
+            return Point3(self._ray_hit)
         return None
 
     def grab_dice(self):
         self.holding_dice = True
+        self.at_rest = None
+        self.slow_checks = 0
         self.score_txt.setText("Aiming...")
         mouse_pos = self.get_mouse_in_world()
         if mouse_pos: self.last_mouse_pos_3d = mouse_pos
 
         for body in self.dice:
+            body.setActive(True)
             body.setKinematic(True)
             body.setCollisionResponse(False)
 
@@ -222,58 +333,82 @@ class DiceSimulator(ShowBase):
             body.applyTorqueImpulse(spin)
 
     def update(self, task):
-        dt = globalClock.getDt()
+        # doPhysics keeps its own fixed-step accumulator; clamping here makes a
+        # hitch drop time explicitly instead of stretching the drag spin too
+        dt = min(globalClock.getDt(), MAX_FRAME_DT)
         
         # --- DRAG LOGIC ---
         if self.holding_dice:
             target_pos = self.get_mouse_in_world()
             
             if target_pos:
-                # Use PHYSICS DIMENSIONS for clamping
-                bounds_x = (TABLE_WIDTH_PHYSICS / 2.0) - DIE_SIZE
-                bounds_y = (TABLE_DEPTH_PHYSICS / 2.0) - DIE_SIZE
-                target_pos.x = max(-bounds_x, min(bounds_x, target_pos.x))
-                target_pos.y = max(-bounds_y, min(bounds_y, target_pos.y))
+                # Clamp to the table; each component is read once
+                x, y = target_pos.x, target_pos.y
+                if x > DRAG_BOUNDS_X: target_pos.x = DRAG_BOUNDS_X
+                elif x < -DRAG_BOUNDS_X: target_pos.x = -DRAG_BOUNDS_X
+                if y > DRAG_BOUNDS_Y: target_pos.y = DRAG_BOUNDS_Y
+                elif y < -DRAG_BOUNDS_Y: target_pos.y = -DRAG_BOUNDS_Y
                 
                 if dt > 0:
                     self.mouse_velocity = (target_pos - self.last_mouse_pos_3d) / dt
                 self.last_mouse_pos_3d = target_pos
                 
-                for i, body in enumerate(self.dice):
-                    offset = Vec3(-0.8 + (i*1.6), 0, 0)
-                    np = NodePath(body)
-                    new_pos = target_pos + offset
-                    np.setPos(new_pos)
-                    np.setHpr(np.getHpr() + Vec3(100*dt, 50*dt, 0))
-
-        self.world.doPhysics(dt, 10, 1.0/180.0)
-        
-        # Scoring
-        if not self.holding_dice:
-            speed = sum(b.getLinearVelocity().length() + b.getAngularVelocity().length() for b in self.dice)
-            if speed < 0.1:
-                total = sum(self.get_die_number(b) for b in self.dice)
-                self.score_txt.setText(f"TOTAL: {total}")
-            else:
-                self.score_txt.setText("Rolling...")
+                spin = Vec3(100*dt, 50*dt, 0)
+                for np, offset in zip(self.dice_nps, self.drag_offsets):
+                    np.setPosHpr(target_pos + offset, np.getHpr() + spin)
 
+        self.world.doPhysics(dt, PHYSICS_MAX_SUBSTEPS, PHYSICS_STEP)
         return task.cont
 
+    def update_score(self, task):
+        # Runs every SETTLE_CHECK_INTERVAL rather than every frame
+        if self.at_rest and not any(b.isActive() for b in self.dice):
+            # Scored dice that Bullet still has asleep cannot have changed
+            return task.again
+        if not self.holding_dice:
+            # Stop summing as soon as the dice are known to still be moving
+            speed = 0.0
+            for b in self.dice:
+                speed += b.getLinearVelocity().length() + b.getAngularVelocity().length()
+                if speed >= SETTLE_SPEED: break
+            if speed < SETTLE_SPEED:
+                self.slow_checks += 1
+                if self.slow_checks < SETTLE_CHECKS:
+                    # Not slow for long enough yet; keep the current state
+                    return task.again
+            else:
+                self.slow_checks = 0
+            # Only score and retitle when the dice start or stop moving
+            at_rest = self.slow_checks >= SETTLE_CHECKS
+            if at_rest != self.at_rest:
+                self.at_rest = at_rest
+                if at_rest:
+                    # Put the settled dice to sleep so Bullet stops integrating them
+                    for b in self.dice:
+                        b.setActive(False)
+                    total = sum(self.get_die_number(b) for b in self.dice)
+                    self.score_txt.setText(f"TOTAL: {total}")
+                else:
+                    self.score_txt.setText("Rolling...")
+
+        return task.again
+
     # --- CREATE DICE ---
     def create_die_body(self, pos):
-        shape = BulletBoxShape(Vec3(DIE_SIZE, DIE_SIZE, DIE_SIZE))
+        # The caller attaches the body to self.world
         body = BulletRigidBodyNode('Die')
         body.setMass(1.0)
-        body.addShape(shape)
+        body.addShape(self.die_shape)
         body.setFriction(FRICTION_FELT)
         body.setRestitution(BOUNCINESS)
         body.setAngularDamping(DAMPING_ANGULAR)
-        body.setCcdMotionThreshold(1e-7); body.setCcdSweptSphereRadius(0.2)
+        body.setCcdMotionThreshold(CCD_MOTION_THRESHOLD); body.setCcdSweptSphereRadius(0.2)
+        body.setDeactivationEnabled(True); body.setDeactivationTime(0.5)
         np = self.render.attachNewNode(body)
         np.setPos(pos)
-        self.world.attachRigidBody(body)
         self.build_visual_die(np)
         self.dice.append(body)
+        self.dice_nps.append(np)
 
     def build_visual_die(self, parent):
         path = os.path.join(SCRIPT_DIR, FOLDER_NAME, DICE_FILE_NAME)
@@ -288,29 +423,50 @@ class DiceSimulator(ShowBase):
             except: 
                 print("Dice model load failed, using fallback.")
             
-        cm = CardMaker('face'); cm.setFrame(-DIE_SIZE, DIE_SIZE, -DIE_SIZE, DIE_SIZE) 
+        if self.fallback_die is None:
+            self.fallback_die = self.build_fallback_die()
+        # every die shares the one cube
+        self.fallback_die.instanceTo(parent)
+
+    def build_fallback_die(self):
+        # A single GeomNode textured from the face atlas, so the cube is one
+        # draw call; each side sits where a CardMaker card at (pos, hpr) would.
+        vdata = GeomVertexData('die', GeomVertexFormat.getV3n3t2(), Geom.UHStatic)
+        vdata.setNumRows(4 * len(DIE_FACES))
+        vertex = GeomVertexWriter(vdata, 'vertex')
+        normal = GeomVertexWriter(vdata, 'normal')
+        texcoord = GeomVertexWriter(vdata, 'texcoord')
+        tris = GeomTriangles(Geom.UHStatic)
+        corners = [(-DIE_SIZE, -DIE_SIZE, 0, 0), (DIE_SIZE, -DIE_SIZE, 1, 0),
+                   (DIE_SIZE, DIE_SIZE, 1, 1), (-DIE_SIZE, DIE_SIZE, 0, 1)]
+        du, dv = 1.0 / ATLAS_COLS, 1.0 / ATLAS_ROWS
+        for i, (n, p, h) in enumerate(DIE_FACES):
+            mat = TransformState.makePosHpr(p, h).getMat()
+            col, row = _atlas_cell(n)
+            u0, v0 = col * du, 1.0 - (row + 1) * dv
+            face_normal = mat.xformVec(Vec3(0, -1, 0))
+            for x, z, u, v in corners:
+                vertex.addData3(mat.xformPoint(Point3(x, 0, z)))
+                normal.addData3(face_normal)
+                texcoord.addData2(u0 + u * du, v0 + v * dv)
+            tris.addVertices(4*i, 4*i + 1, 4*i + 2); tris.addVertices(4*i, 4*i + 2, 4*i + 3)
+        geom = Geom(vdata); geom.addPrimitive(tris)
+        node = GeomNode('fallback_die'); node.addGeom(geom)
+        die = NodePath(node)
         m = Material(); m.setSpecular(LColor(1,1,1,1)); m.setShininess(60.0); m.setAmbient(LColor(0.5,0.5,0.5,1))
-        parent.setMaterial(m)
-        faces = [
-            (1, Vec3(0,0,DIE_SIZE), Vec3(0,-90,0)), (6, Vec3(0,0,-DIE_SIZE), Vec3(0,90,0)),
-            (2, Vec3(0,-DIE_SIZE,0), Vec3(0,0,0)), (5, Vec3(0,DIE_SIZE,0), Vec3(180,0,180)),
-            (3, Vec3(-DIE_SIZE,0,0), Vec3(90,0,0)), (4, Vec3(DIE_SIZE,0,0), Vec3(-90,0,0))
-        ]
-        for n, p, h in faces:
-            f = parent.attachNewNode(cm.generate()); f.setPos(p); f.setHpr(h); f.setTexture(self.face_textures[n]); f.setTwoSided(True)
+        die.setMaterial(m)
+        die.setTexture(self.load_face_atlas()); die.setTwoSided(True)
+        return die
 
     def get_die_number(self, body):
-        q = body.getTransform().getQuat()
-        w = Vec3(0, 0, 1)
-        alignments = [
-            (q.getUp().dot(w),      DIE_AXIS_MAPPING["UP"]),    
-            (-q.getUp().dot(w),     DIE_AXIS_MAPPING["DOWN"]),  
-            (q.getRight().dot(w),   DIE_AXIS_MAPPING["RIGHT"]), 
-            (-q.getRight().dot(w),  DIE_AXIS_MAPPING["LEFT"]),  
-            (q.getForward().dot(w), DIE_AXIS_MAPPING["FWD"]),   
-            (-q.getForward().dot(w),DIE_AXIS_MAPPING["BACK"])   
-        ]
-        return max(alignments, key=lambda x: x[0])[1]
+        # Row i of the transform is local axis i (X right, Y forward, Z up) in
+        # world space; the axis nearest vertical, and its sign, give the face.
+        m = body.getTransform().getMat()
+        axis, z = 2, m.getCell(2, 2)
+        for i in (0, 1):
+            zi = m.getCell(i, 2)
+            if abs(zi) > abs(z): axis, z = i, zi
+        return _AXIS_FACES[axis][0 if z >= 0 else 1]
 
     # --- CREATE TABLE (WITH ALIGNMENT CONTROLS) ---
     def create_poker_table(self):
@@ -320,6 +476,10 @@ class DiceSimulator(ShowBase):
         self.world.attachRigidBody(node)
         
         # 2. Invisible Physics Walls (Calculated from TABLE_WIDTH_PHYSICS)
+        # One static body with a box shape per wall keeps a single broadphase entry
+        walls = BulletRigidBodyNode('Walls'); walls.setRestitution(0.5)
+        # Opposite walls are the same size and share one shape
+        shapes = {}
         for pos, sz in [
             (Point3(TABLE_WIDTH_PHYSICS/2+0.5,0,7),Vec3(1,TABLE_DEPTH_PHYSICS+5,15)), 
             (Point3(-TABLE_WIDTH_PHYSICS/2-0.5,0,7),Vec3(1,TABLE_DEPTH_PHYSICS+5,15)),
@@ -327,8 +487,11 @@ class DiceSimulator(ShowBase):
             (Point3(0,-TABLE_DEPTH_PHYSICS/2-0.5,7),Vec3(TABLE_WIDTH_PHYSICS+5,1,15)),
             (Point3(0,0,WALL_HEIGHT),Vec3(TABLE_WIDTH_PHYSICS+5,TABLE_DEPTH_PHYSICS+5,1))
         ]:
-            w = BulletRigidBodyNode('Wall'); w.addShape(BulletBoxShape(sz/2)); w.setRestitution(0.5)
-            self.world.attachRigidBody(w); self.render.attachNewNode(w).setPos(pos)
+            key = tuple(sz)
+            if key not in shapes:
+                shapes[key] = BulletBoxShape(sz/2)
+            walls.addShape(shapes[key], TransformState.makePos(pos))
+        self.world.attachRigidBody(walls); self.render.attachNewNode(walls)
 
         # 3. Visual Table Model
         path = os.path.join(SCRIPT_DIR, FOLDER_NAME, TABLE_FILE_NAME)
@@ -8,6 +8,18 @@ from items import registry, Effect, Inventory
 class FoodDrinkMixin:
     """Mixin class that adds food and drink functionality to GameManager."""
     
+    def _init_player_state(self, player_name: str):
+        """Give a new player an empty inventory, full energy and no effects.
+
+        Every player must go through this before the other mixin methods are
+        used on them; they no longer create these fields on demand.
+        """
+        player_data = self.players[player_name]
+        player_data['inventory'] = Inventory()
+        player_data['energy'] = 100
+        if player_data.get('active_effects') is None:
+            player_data['active_effects'] = {}
+
     def use_item(self, player_name: str, item_name: str) -> bool:
         """Have a player use a food/drink item."""
         if player_name not in self.players:
@@ -15,19 +27,12 @@ class FoodDrinkMixin:
             
         player_data = self.players[player_name]
         
-        # Initialize inventory if not present
-        if 'inventory' not in player_data:
-            player_data['inventory'] = Inventory()
-        
-        # Initialize energy if not present
-        if 'energy' not in player_data:
-            player_data['energy'] = 100
-            
         item = registry.get_item(item_name)
         if not item:
             return False
             
-        if player_data['inventory'].use_item(item):
+        # Effects go into the player's active_effects, like GameManager.use_item
+        if player_data['inventory'].use_item(item, player_data['active_effects']):
             # Apply energy boost
             player_data['energy'] = min(100, player_data['energy'] + item.energy_value)
             return True
@@ -37,15 +42,11 @@ class FoodDrinkMixin:
     def update_effects(self):
         """Update effects for all players (call each turn)."""
         for player_data in self.players.values():
-            # Initialize inventory if not present
-            if 'inventory' not in player_data:
-                player_data['inventory'] = Inventory()
-            
-            # Initialize energy if not present
-            if 'energy' not in player_data:
-                player_data['energy'] = 100
-                
-            player_data['inventory'].update_effects()
+            effects = player_data['active_effects']
+            for effect in list(effects):
+                effects[effect] -= 1
+                if effects[effect] <= 0:
+                    del effects[effect]
             
             # Decrease energy over time
             player_data['energy'] = max(0, player_data['energy'] - 5)
@@ -57,12 +58,7 @@ class FoodDrinkMixin:
         
         player_data = self.players[player_name]
         
-        # Initialize inventory if not present
-        if 'inventory' not in player_data:
-            player_data['inventory'] = Inventory()
-            
-        return [effect for effect in Effect 
-                if player_data['inventory'].has_effect(effect)]
+        return list(player_data['active_effects'])
     
     def get_player_energy(self, player_name: str) -> int:
         """Get a player's current energy level."""
@@ -71,36 +67,43 @@ class FoodDrinkMixin:
             
         player_data = self.players[player_name]
         
-        # Initialize energy if not present
-        if 'energy' not in player_data:
-            player_data['energy'] = 100
-            
         return player_data['energy']
     
     def apply_effect_bonuses(self, player_name: str, roll_result: int) -> int:
         """Apply any effect bonuses to a roll result."""
+        return self.apply_effect_bonuses_batch(player_name, [roll_result])[0]
+
+    def apply_effect_bonuses_batch(self, player_name: str, rolls: list) -> list:
+        """Apply effect bonuses to several dice at once.
+
+        The player's effects are looked up once for the whole batch, so pass
+        every die of a roll together rather than one at a time.
+        """
         if player_name not in self.players:
-            return roll_result
+            return list(rolls)
             
         player_data = self.players[player_name]
         
-        # Initialize inventory if not present
-        if 'inventory' not in player_data:
-            player_data['inventory'] = Inventory()
-            
-        modified_result = roll_result
+        active = player_data['active_effects']
+        if not active:
+            # Usual case: nothing to apply
+            return list(rolls)
+        luck = Effect.LUCK_BOOST in active
+        focus = Effect.FOCUS_BOOST in active
+        rand = random.random
         
-        # Apply luck boost if active
-        if player_data['inventory'].has_effect(Effect.LUCK_BOOST):
-            if random.random() < 0.3:  # 30% chance of luck boost
+        results = []
+        for modified_result in rolls:
+            # Apply luck boost if active
+            if luck and rand() < 0.3:  # 30% chance of luck boost
                 modified_result = min(6, modified_result + 1)
+            
+            # Apply focus boost if active (prevents very low rolls)
+            if focus:
+                modified_result = max(2, modified_result)
+            results.append(modified_result)
         
-        # Apply focus boost if active
-        if player_data['inventory'].has_effect(Effect.FOCUS_BOOST):
-            # Focus boost prevents very low rolls
-            modified_result = max(2, modified_result)
-        
-        return modified_result
+        return results
     
     def add_item_to_player(self, player_name: str, item_name: str, quantity: int = 1) -> bool:
         """Add an item to a player's inventory."""
@@ -109,10 +112,6 @@ class FoodDrinkMixin:
             
         player_data = self.players[player_name]
         
-        # Initialize inventory if not present
-        if 'inventory' not in player_data:
-            player_data['inventory'] = Inventory()
-            
         item = registry.get_item(item_name)
         if not item:
             return False
@@ -8,6 +8,28 @@ from items.consumables import registry, Effect
 
 audio = AudioManager(audio_folder=r"uno_game\assets")
 
+_FACES = (1, 2, 3, 4, 5, 6)
+
+# Starting record for each player. chips, active_effects, max_chips and
+# item_types_used are filled in per player by GameManager.__init__.
+_PLAYER_TEMPLATE = {
+    'chips': 0,
+    'active_effects': None,  # {Effect: turns_remaining}
+    'inventory': None,  # set per player by _init_player_state, with 'energy'
+    # Achievement tracking stats
+    'rounds_won': 0,
+    'rolls_total': 0,
+    'items_used': 0,
+    'items_bought': 0,
+    'chips_spent': 0,
+    'shop_visits_no_buy': 0,
+    'triples_rolled': 0,
+    'pairs_rolled': 0,
+    'straights_rolled': 0,
+    'max_chips': 0,
+    'item_types_used': None,
+}
+
 
 class GameManager(FoodDrinkMixin):
     """Manages the state and logic of a Zanzibar dice game with food/drink support."""
@@ -25,23 +47,16 @@ class GameManager(FoodDrinkMixin):
         if len(player_names) < 2:
             raise ValueError("Zanzibar requires at least 2 players.")
 
-        self.players = {name: {
-            'chips': starting_chips,
-            'active_effects': {},  # {Effect: turns_remaining}
-            'inventory': None,  # Will be set from main.py
-            # Achievement tracking stats
-            'rounds_won': 0,
-            'rolls_total': 0,
-            'items_used': 0,
-            'items_bought': 0,
-            'chips_spent': 0,
-            'shop_visits_no_buy': 0,
-            'triples_rolled': 0,
-            'pairs_rolled': 0,
-            'straights_rolled': 0,
-            'max_chips': starting_chips,
-            'item_types_used': set(),
-        } for name in player_names}
+        # copy the shared template; mutable members are created per player
+        self.players = {name: dict(
+            _PLAYER_TEMPLATE,
+            chips=starting_chips,
+            active_effects={},
+            max_chips=starting_chips,
+            item_types_used=set(),
+        ) for name in player_names}
+        for name in player_names:
+            self._init_player_state(name)
         self.player_order = player_names
         self.round_results = {}
         self.current_round = 0
@@ -111,7 +126,7 @@ class GameManager(FoodDrinkMixin):
                 return {'final_roll': current_roll, 'rolls_taken': 1}
         
         # initial roll
-        current_roll = [random.randint(1, 6) for _ in range(3)]
+        current_roll = random.choices(_FACES, k=3)
 
         # roll_count tracks how many rolls have been used (1..max_rolls)
         for roll_num in range(1, max_rolls + 1):
@@ -142,7 +157,7 @@ class GameManager(FoodDrinkMixin):
                 kept_dice.append(max(current_roll))
 
             num_to_reroll = 3 - len(kept_dice)
-            new_dice = [random.randint(1, 6) for _ in range(num_to_reroll)]
+            new_dice = random.choices(_FACES, k=num_to_reroll)
             current_roll = kept_dice + new_dice
 
         return {'final_roll': current_roll, 'rolls_taken': max_rolls}
@@ -401,13 +416,18 @@ class GameManager(FoodDrinkMixin):
             
         return True
     
-    def update_effects(self, player_name: str):
+    def update_effects(self, player_name: str = None):
         """Decrease duration of active effects and remove expired ones.
         Called at the end of each player's turn.
         
         Args:
-            player_name: Name of the player whose effects to update
+            player_name: Name of the player whose effects to update. When
+                omitted, every player is updated and loses turn energy, as in
+                FoodDrinkMixin.update_effects.
         """
+        if player_name is None:
+            super().update_effects()
+            return
         if player_name not in self.players:
             return
             
@@ -524,7 +544,7 @@ class GameManager(FoodDrinkMixin):
             # updates/draws the notifier for a couple of seconds.
             try:
                 # import notifier directly to avoid re-importing graphics module
-                from graphics.achivments import notifier
+                from graphics.achivments import notifier, smart_present
                 clk = pygame.time.Clock()
                 start_ms = pygame.time.get_ticks()
                 duration_ms = 1800
@@ -535,10 +555,10 @@ class GameManager(FoodDrinkMixin):
                             raise SystemExit
                     try:
                         notifier.update()
-                        notifier.draw(self.screen)
+                        # only the popup area changes over the finished screen
+                        smart_present([notifier.draw(self.screen)])
                     except Exception:
-                        pass
-                    pygame.display.flip()
+                        pygame.display.flip()
                     clk.tick(60)
             except Exception:
                 # If notifier isn't available, continue silently
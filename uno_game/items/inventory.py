@@ -85,6 +85,10 @@ class Inventory:
         for effect in expired:
             del self.active_effects[effect]
     
+    def get_active_effects(self) -> List[Effect]:
+        """Get the effects that are currently active."""
+        return list(self.active_effects)
+
     def has_effect(self, effect: Effect) -> bool:
         """Check if a specific effect is active."""
         return effect in self.active_effects
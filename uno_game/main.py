@@ -26,6 +26,7 @@ from ui.change_song_menu import ChangeSongMenu
 from ui.audio_settings import AudioSettingsMenu
 from ui.keybindings_menu import KeybindingsMenu
 from ui.achievements_menu import AchievementsMenu
+from ui.ui_utils import get_sys_font, render_text
 from ui.shop_menu import ShopMenu
 from ui.consumables_menu import ConsumablesMenu
 from ui.status_display import StatusDisplay
@@ -45,6 +46,11 @@ SETTINGS_PATH = os.path.join(BASE_DIR, 'settings.json')
 # Cache for pre-rendered die sprites: {(size, face): Surface}
 DIE_SPRITE_CACHE = {}
 
+# Pip groups shown by each face: 1 = centre, 2 = top-left/bottom-right,
+# 4 = top-right/bottom-left, 8 = middle-left/middle-right
+PIP_CENTER, PIP_DIAG, PIP_ANTI, PIP_MID = 1, 2, 4, 8
+PIP_GROUPS = {1: 0b0001, 2: 0b0010, 3: 0b0011, 4: 0b0110, 5: 0b0111, 6: 0b1110}
+
 # Particle system for dice trails
 class DiceParticle:
     def __init__(self, x, y, vx, vy, color, lifetime):
@@ -203,21 +209,27 @@ def _render_die_sprite(size: int, face: int) -> pygame.Surface:
     row_3 = size * 0.78
     pr = max(3, size // 11)
 
-    if face in (1, 3, 5):
+    groups = PIP_GROUPS.get(face, 0)
+    if groups & PIP_CENTER:
         pip(col_2, row_2, pr)
-    if face in (2, 3, 4, 5, 6):
+    if groups & PIP_DIAG:
         pip(col_1, row_1, pr)
         pip(col_3, row_3, pr)
-    if face in (4, 5, 6):
+    if groups & PIP_ANTI:
         pip(col_3, row_1, pr)
         pip(col_1, row_3, pr)
-    if face == 6:
+    if groups & PIP_MID:
         pip(col_1, row_2, pr)
         pip(col_3, row_2, pr)
 
     # 8. Outer border
     pygame.draw.rect(surf, (32, 32, 34), rect, 1, border_radius=border_radius)
 
+    # Store in the display's pixel format so every later blit/scale/rotate
+    # skips the per-call format conversion
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+
     DIE_SPRITE_CACHE[key] = surf
     return surf
 
@@ -241,19 +253,31 @@ def draw_die(surface: pygame.Surface, x: int, y: int, size: int, value: int):
         row_1 = y + size * 0.25
         row_2 = y + size * 0.5
         row_3 = y + size * 0.75
-        if value in (1, 3, 5):
+        groups = PIP_GROUPS.get(value, 0)
+        if groups & PIP_CENTER:
             pip(col_2, row_2)
-        if value in (2, 3, 4, 5, 6):
+        if groups & PIP_DIAG:
             pip(col_1, row_1)
             pip(col_3, row_3)
-        if value in (4, 5, 6):
+        if groups & PIP_ANTI:
             pip(col_3, row_1)
             pip(col_1, row_3)
-        if value == 6:
+        if groups & PIP_MID:
             pip(col_1, row_2)
             pip(col_3, row_2)
 
 
+def draw_dice(surface: pygame.Surface, size: int, placements):
+    """Draw several dice in one blits() call; placements are (x, y, value)."""
+    try:
+        seq = [(_render_die_sprite(size, v), (int(x), int(y))) for x, y, v in placements]
+    except Exception:
+        for x, y, v in placements:
+            draw_die(surface, x, y, size, v)
+        return
+    surface.blits(seq, doreturn=False)
+
+
 def draw_die_flipping(surface: pygame.Surface, x: int, y: int, size: int, from_val: int, to_val: int, progress: float, particles=None):
     """Draw a die with realistic physics: 3D tumbling, bounce with deceleration, and particle trails.
     
@@ -447,7 +471,7 @@ def run_dice_demo(screen: pygame.Surface, audio: AudioManager, num_dice: int = 1
                             p = min(1.0, max(0.0, (progress - stagger) / (1.0 - stagger)))
                             draw_die_flipping(screen, x, y, die_size, from_faces[i], d.get('value', 0), p)
 
-                        font = pygame.font.SysFont('Arial', 20)
+                        font = get_sys_font('Arial', 20)
                         txt = font.render(f"Rolling...", True, (255, 255, 255))
                         screen.blit(txt, (20, 20))
 
@@ -485,6 +509,7 @@ def run_dice_demo(screen: pygame.Surface, audio: AudioManager, num_dice: int = 1
         top_y = 100
         bottom_y = 220
 
+        placements = []
         for i, d in enumerate(rolls):
             if i < 5:
                 x = start_x + i * die_spacing
@@ -492,7 +517,8 @@ def run_dice_demo(screen: pygame.Surface, audio: AudioManager, num_dice: int = 1
             else:
                 x = start_x + (i - 5) * die_spacing
                 y = bottom_y
-            draw_die(screen, x, y, die_size, d.get('value', 0))
+            placements.append((x, y, d.get('value', 0)))
+        draw_dice(screen, die_size, placements)
 
         total = sum(d.get('value', 0) for d in rolls)
         txt = font.render(f"Roll total: {total}    (R to roll, Esc to return)", True, (255, 255, 255))
@@ -1103,11 +1129,17 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
             inventory_menu = ConsumablesMenu(screen, player_data['inventory'])
             
             # Get items as ConsumableItem objects
-            items = []
-            for item_name, quantity in player_data['inventory'].get_all_items().items():
-                item = registry.get_item(item_name)
-                if item and quantity > 0:
-                    items.append(item)
+            def owned_items():
+                # check the quantity first so empty entries skip the registry
+                owned = []
+                for item_name, quantity in player_data['inventory'].get_all_items().items():
+                    if quantity > 0:
+                        item = registry.get_item(item_name)
+                        if item:
+                            owned.append(item)
+                return owned
+
+            items = owned_items()
             
             if items:
                 inventory_menu.selected_item = items[0]
@@ -1130,11 +1162,7 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
                                 except Exception:
                                     pass
                                 # Refresh items list
-                                items = []
-                                for item_name, quantity in player_data['inventory'].get_all_items().items():
-                                    item = registry.get_item(item_name)
-                                    if item and quantity > 0:
-                                        items.append(item)
+                                items = owned_items()
                                 # Update selected item
                                 if items:
                                     inventory_menu.selected_item = items[0]
@@ -1172,7 +1200,7 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
                 screen.fill((20, 20, 30))
                 if not items:
                     # Show empty inventory message
-                    empty_font = pygame.font.SysFont('Arial', 24)
+                    empty_font = get_sys_font('Arial', 24)
                     msg = empty_font.render("Inventory is empty! Press S to shop.", True, (220, 220, 220))
                     msg_rect = msg.get_rect(center=(screen.get_width()//2, screen.get_height()//2))
                     screen.blit(msg, msg_rect)
@@ -1354,7 +1382,7 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
             cached_fonts[header_font_key] = pygame.font.SysFont(font_family, font_size)
         header_font = cached_fonts[header_font_key]
         
-        header = header_font.render(header_text, True, header_color)
+        header = render_text(header_font, header_text, header_color)
         screen.blit(header, (20, 20))
 
         # Isaiah NPC (left side) -- do not draw in main gameplay
@@ -1372,8 +1400,8 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
 
         # show transient round message (winner) if present
         if round_message and time.time() < round_message_end:
-            rm_font = pygame.font.SysFont('Arial', 28, bold=True)
-            rm_surf = rm_font.render(round_message, True, (255, 220, 80))
+            rm_font = get_sys_font('Arial', 28, bold=True)
+            rm_surf = render_text(rm_font, round_message, (255, 220, 80))
             rmr = rm_surf.get_rect(center=(screen.get_width() // 2, 60))
             screen.blit(rm_surf, rmr)
         else:
@@ -1489,11 +1517,11 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
             if name_font_key not in cached_fonts:
                 cached_fonts[name_font_key] = pygame.font.SysFont(font_family, scale_ui(22), bold=is_current)
             name_font = cached_fonts[name_font_key]
-            name_txt = name_font.render(name, True, color)
+            name_txt = render_text(name_font, name, color)
             screen.blit(name_txt, (name_x, content_y - 2))
             
             chip_color = (0, 0, 0) if high_contrast_mode else (200, 200, 200)
-            chip_txt = get_font(scale_ui(16)).render(f'{chips} chips', True, chip_color)
+            chip_txt = render_text(get_font(scale_ui(16)), f'{chips} chips', chip_color)
             screen.blit(chip_txt, (name_x, content_y + scale_ui(20)))
             
             # Draw active effects
@@ -1527,15 +1555,14 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
                         except Exception:
                             pass
                 else:
-                    for j, v in enumerate(final):
-                        x = dice_x + j * (die_size + spacing_x)
-                        draw_die(screen, x, dice_y, die_size, v)
+                    draw_dice(screen, die_size, [(dice_x + j * (die_size + spacing_x), dice_y, v)
+                                                 for j, v in enumerate(final)])
                 
                 # render the computed hand name/score (below name)
                 score_info = GameManager._calculate_score(final)
                 try:
                     score_color = (0, 0, 0) if high_contrast_mode else (220, 200, 100)
-                    score_txt = get_font(scale_ui(14)).render(score_info.get('name', ''), True, score_color)
+                    score_txt = render_text(get_font(scale_ui(14)), score_info.get('name', ''), score_color)
                     screen.blit(score_txt, (name_x, content_y + scale_ui(38)))
                 except Exception:
                     pass
@@ -1580,13 +1607,13 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
                     item_font = cached_fonts[item_font_key]
                     short_name = item_name[:10] + '..' if len(item_name) > 10 else item_name
                     text_color = (0, 0, 0) if high_contrast_mode else (230, 230, 230)
-                    name_surf = item_font.render(short_name, True, text_color)
+                    name_surf = render_text(item_font, short_name, text_color)
                     name_rect = name_surf.get_rect(centerx=slot_rect.centerx, top=slot_rect.top + scale_ui(6))
                     screen.blit(name_surf, name_rect)
                     
                     # Quantity
                     qty_color = (40, 40, 40) if high_contrast_mode else (200, 200, 200)
-                    qty_surf = item_font.render(f'x{qty}', True, qty_color)
+                    qty_surf = render_text(item_font, f'x{qty}', qty_color)
                     qty_rect = qty_surf.get_rect(centerx=slot_rect.centerx, top=name_rect.bottom + scale_ui(2))
                     screen.blit(qty_surf, qty_rect)
                     
@@ -1596,7 +1623,7 @@ def run_game_engine(screen: pygame.Surface, audio: AudioManager):
                         cached_fonts[key_font_key] = pygame.font.SysFont(font_family, scale_ui(16), bold=True)
                     key_font = cached_fonts[key_font_key]
                     key_color = (0, 0, 0) if high_contrast_mode else (220, 185, 75)
-                    key_surf = key_font.render(str(idx + 1), True, key_color)
+                    key_surf = render_text(key_font, str(idx + 1), key_color)
                     key_rect = key_surf.get_rect(centerx=slot_rect.centerx, bottom=slot_rect.bottom - scale_ui(4))
                     screen.blit(key_surf, key_rect)
                     
@@ -1804,6 +1831,13 @@ def main():
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Game - Launcher")
 
+    # Render achievement popup text up front so unlocks don't hit the font renderer mid-game
+    try:
+        from achievements import DEFAULT_ACHIEVEMENTS
+        notifier.preload([(a['title'], a['desc']) for a in DEFAULT_ACHIEVEMENTS])
+    except Exception:
+        pass
+
     # Show the intro/splash screen before the main menu
     try:
         from ui.intro_screen import IntroScreen
@@ -38,16 +38,6 @@ class AchievementsMenu:
         self.y = (self.screen.get_height() - self.height) // 2
         self.bg_color = (18, 18, 22)
         self.border_color = (100, 100, 120)
-        # icon cache
-        self._icon_cache = {}
-        # palette for unlocked icons
-        self._palette = [
-            (220, 80, 60),
-            (80, 180, 120),
-            (90, 120, 220),
-            (200, 140, 220),
-            (240, 200, 90),
-        ]
         # Scrolling support
         self.scroll_offset = 0
         self.max_visible_items = 6  # Number of achievements visible at once
@@ -69,38 +59,19 @@ class AchievementsMenu:
         self.screen.blit(d, (cx + 26, pos_y + 26))
 
     def _get_icon_surface(self, aid: str, size: int, unlocked: bool) -> pygame.Surface:
-        key = (aid, size, bool(unlocked))
-        if key in self._icon_cache:
-            return self._icon_cache[key]
-
-        # deterministic pseudo-random pattern based on id
-        h = abs(hash(aid))
-        seed = h
-        # choose a palette color for unlocked
-        color = self._palette[seed % len(self._palette)] if unlocked else (120, 120, 120)
-
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        # pixel grid: make a low-res grid and scale up
-        grid = 6  # 6x6 grid
-        cell = size // grid
-        for gy in range(grid):
-            for gx in range(grid):
-                # symmetric pattern horizontally for nicer icons
-                idx = (gx + gy * grid) ^ (seed & 0xFF)
-                on = (idx % 3) == 0 or ((gx + gy) % 5 == 0 and (seed >> (gx+gy)) & 1)
-                # add more chance if unlocked
-                if unlocked:
-                    on = on or ((idx + seed) % 4 == 0)
-                if on:
-                    rx = gx * cell
-                    ry = gy * cell
-                    rect = pygame.Rect(rx, ry, cell + 1, cell + 1)
-                    pygame.draw.rect(surf, color, rect)
-
-        # add a subtle border for visibility
-        pygame.draw.rect(surf, (40, 40, 40), (0, 0, size, size), 1)
-        self._icon_cache[key] = surf
-        return surf
+        # same icons (and cache) as the unlock popup
+        icon = None
+        try:
+            from achievements import get_icon_surface
+            icon = get_icon_surface(aid, size, unlocked)
+        except Exception:
+            pass
+        if icon is None:
+            # plain placeholder tile when the shared helper is unavailable
+            icon = pygame.Surface((size, size), pygame.SRCALPHA)
+            icon.fill((90, 90, 90) if unlocked else (50, 50, 50))
+            pygame.draw.rect(icon, (40, 40, 40), (0, 0, size, size), 1)
+        return icon
 
     def draw(self):
         # panel
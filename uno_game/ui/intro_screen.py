@@ -5,6 +5,8 @@ import pygame
 import time
 import random
 
+from .ui_utils import get_sys_font
+
 
 class IntroScreen:
     """Simple intro/splash screen with fade-in and skip support.
@@ -119,7 +121,7 @@ class IntroScreen:
             # marquee/backboard + neon sign centered (bigger, with bulbs and halo)
             try:
                 sign_text = 'CASINO'
-                neon_font = pygame.font.SysFont(self.title_font_name, max(34, int(width * 0.04)), bold=True)
+                neon_font = get_sys_font(self.title_font_name, max(34, int(width * 0.04)), bold=True)
                 # marquee/backboard
                 board_w = int(width * 0.52)
                 board_h = int(height * 0.10)
@@ -329,7 +331,8 @@ class IntroScreen:
         # audio tick setup
         last_tick_index = None
         tick_sfx_name = None
-        tick_channel_id = 7
+        # dedicated channel, kept out of the manager's round-robin sfx pool
+        tick_channel_id = getattr(audio_manager, 'UI_CHANNEL', None)
         landing_sfx_name = None
         bounce_sfx_name = None
         if audio_manager is not None:
@@ -569,8 +572,8 @@ class IntroScreen:
                 red = (200, 20, 20)
                 black = (20, 20, 20)
                 green = (16, 120, 24)
-                label_font = pygame.font.SysFont(self.title_font_name, max(14, int(height * 0.03)))
-                num_font = pygame.font.SysFont(self.title_font_name, max(12, int(height * 0.028)))
+                label_font = get_sys_font(self.title_font_name, max(14, int(height * 0.03)))
+                num_font = get_sys_font(self.title_font_name, max(12, int(height * 0.028)))
                 # Left column: 0 and 00 stacked
                 left_rect = pygame.Rect(tbl_x, tbl_y, left_col_w, tbl_h)
                 pygame.draw.rect(screen, green, left_rect)
@@ -1051,7 +1054,7 @@ class IntroScreen:
                     except Exception:
                         pass
                     # pocket label font scales with wheel radius for consistent look
-                    label_font = pygame.font.SysFont(self.title_font_name, max(10, int(wheel_radius * 0.18)))
+                    label_font = get_sys_font(self.title_font_name, max(10, int(wheel_radius * 0.18)))
                     num_surf = label_font.render(label, True, num_color)
                     num_rect = num_surf.get_rect(center=(int(tx), int(ty)))
                     base_wheel_surf.blit(num_surf, num_rect)
@@ -5,6 +5,7 @@ from typing import Callable, Optional
 
 # Ensure this matches your file name for the sprite code
 from .Isaiah_npc import IsaiahNPCPixelArt
+from .ui_utils import get_sys_font
 from .red_avatar import RedHoodiePixelAvatar
 
 # ---------------------------------------------------------
@@ -450,7 +451,7 @@ class StartMenu:
                     text_to_show = "Psst... Click me!"
 
                 if text_to_show:
-                    tip_font = pygame.font.SysFont('Arial', 18)
+                    tip_font = get_sys_font('Arial', 18)
                     lines = []
                     max_line_length = 32
                     words = text_to_show.split()
@@ -3,6 +3,7 @@ Visual display for active status effects on players.
 """
 import pygame
 from items.consumables import Effect
+from ui.ui_utils import get_sys_font
 
 
 class StatusDisplay:
@@ -178,7 +179,7 @@ def draw_compact_player_status(screen: pygame.Surface, player_name: str, chips:
         x: X coordinate
         y: Y coordinate
     """
-    font = pygame.font.SysFont('Arial', 18, bold=True)
+    font = get_sys_font('Arial', 18, bold=True)
     
     # Background panel
     panel_width = 200
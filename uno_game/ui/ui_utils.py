@@ -2,6 +2,29 @@
 
 import pygame
 import time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def get_sys_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """Return a shared SysFont; font matching is far too slow to redo every frame."""
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+# Rendered text keyed by (font, text, color); HUD labels repeat every frame
+_TEXT_CACHE_MAX = 256
+_text_cache = {}
+
+
+def render_text(font: pygame.font.Font, text: str, color) -> pygame.Surface:
+    """Cached antialiased ``font.render``; callers must not draw on the result."""
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            _text_cache.clear()
+        surf = _text_cache[key] = font.render(text, True, color)
+    return surf
 
 
 def fade_transition(screen: pygame.Surface, duration: float = 0.5, fade_out: bool = True):
@@ -179,7 +202,7 @@ def show_tooltip(screen: pygame.Surface, text: str, x: int, y: int,
         max_width: Maximum width of tooltip
         padding: Internal padding
     """
-    font = pygame.font.SysFont('Arial', 16)
+    font = get_sys_font('Arial', 16)
     
     # Word wrap
     words = text.split(' ')